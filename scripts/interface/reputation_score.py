@@ -33,7 +33,11 @@ Algorithm Weights:
 
 import logging
 import json
+import os
 import sqlite3
+import time
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
@@ -42,9 +46,16 @@ from enum import Enum
 import statistics
 import sys
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from collectors.blockchain_db import normalize_address
 from collectors.network_authenticity_analyzer import (
     NetworkAuthenticityAnalyzer,
     NetworkAnalysis,
@@ -55,6 +66,32 @@ from collectors.network_authenticity_analyzer import (
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+BLOCKCHAIN_DB_PATH = Path(__file__).parent.parent.parent / 'db' / 'blockchain_tracking.db'
+
+
+# Batch worker state (set once per process by _init_batch_worker)
+_batch_analyzer: Optional[NetworkAuthenticityAnalyzer] = None
+_batch_profiles: Dict[str, WalletProfile] = {}
+
+
+def _init_batch_worker(db_path: str, base_profiles: Dict[str, WalletProfile]):
+    global _batch_analyzer, _batch_profiles
+    _batch_analyzer = NetworkAuthenticityAnalyzer(db_path)
+    _batch_profiles = base_profiles
+
+
+def _analyze_batch_artist(job: Tuple) -> Tuple[int, NetworkAnalysis]:
+    """Network analysis for one (artist_id, wallet, collectors, transfers) job"""
+    artist_id, wallet_address, collector_addresses, transfers = job
+    analysis = _batch_analyzer.analyze_artist_network(
+        artist_address=wallet_address,
+        collector_addresses=collector_addresses,
+        transfers=transfers,
+        base_profiles=_batch_profiles,
+        store=False
+    )
+    return artist_id, analysis
+
 
 class ReputationState(Enum):
     """4 reputation states - one-time badge assignment"""
@@ -236,22 +273,8 @@ class ReputationScorer:
             transfers=transfers or []
         )
 
-        # Convert to our metrics format
-        metrics = self._extract_metrics(network_analysis)
-
-        # Calculate component scores
-        vitality_score = self._calc_collector_vitality(metrics)
-        network_score = self._calc_network_authenticity(metrics)
-        transaction_score = self._calc_transaction_legitimacy(metrics)
-        timeline_score = self._calc_timeline_health(metrics)
-
-        # Weighted combination
-        weighted_score = (
-            vitality_score * self.WEIGHTS['collector_vitality'] +
-            network_score * self.WEIGHTS['network_authenticity'] +
-            transaction_score * self.WEIGHTS['transaction_legitimacy'] +
-            timeline_score * self.WEIGHTS['timeline_health']
-        )
+        metrics, vitality_score, network_score, transaction_score, timeline_score, weighted_score = \
+            self._score_analysis(network_analysis)
 
         # Get percentile rank
         percentile_rank = self._calculate_percentile(weighted_score)
@@ -324,6 +347,32 @@ class ReputationScorer:
             'badge_display': self._get_badge_display(reputation_state)
         }
 
+    def _score_analysis(self, network_analysis: NetworkAnalysis) -> Tuple:
+        """
+        Metrics, component scores and weighted score for a network analysis.
+
+        Returns:
+            (metrics, vitality, network, transaction, timeline, weighted)
+        """
+        # Convert to our metrics format
+        metrics = self._extract_metrics(network_analysis)
+
+        # Calculate component scores
+        vitality_score = self._calc_collector_vitality(metrics)
+        network_score = self._calc_network_authenticity(metrics)
+        transaction_score = self._calc_transaction_legitimacy(metrics)
+        timeline_score = self._calc_timeline_health(metrics)
+
+        # Weighted combination
+        weighted_score = (
+            vitality_score * self.WEIGHTS['collector_vitality'] +
+            network_score * self.WEIGHTS['network_authenticity'] +
+            transaction_score * self.WEIGHTS['transaction_legitimacy'] +
+            timeline_score * self.WEIGHTS['timeline_health']
+        )
+
+        return metrics, vitality_score, network_score, transaction_score, timeline_score, weighted_score
+
     def _extract_metrics(self, analysis: NetworkAnalysis) -> AuthenticityMetrics:
         """Extract our metrics from network analysis"""
         metrics = AuthenticityMetrics(
@@ -538,16 +587,7 @@ class ReputationScorer:
 
         if not all_scores:
             # First artist - use absolute thresholds
-            if score >= 80:
-                return 90
-            elif score >= 60:
-                return 70
-            elif score >= 40:
-                return 50
-            elif score >= 20:
-                return 30
-            else:
-                return 10
+            return self._absolute_percentile(score)
 
         all_scores.append(score)
         all_scores.sort()
@@ -557,6 +597,37 @@ class ReputationScorer:
 
         return percentile
 
+    @staticmethod
+    def _absolute_percentile(score: float) -> float:
+        """Percentile stand-in when there is nothing to compare against"""
+        if score >= 80:
+            return 90
+        elif score >= 60:
+            return 70
+        elif score >= 40:
+            return 50
+        elif score >= 20:
+            return 30
+        else:
+            return 10
+
+    def _percentiles(self, scores: List[float], population: List[float]) -> List[float]:
+        """
+        Percentile ranks of many scores against one population in a single
+        pass (same definition as _calculate_percentile: share of the
+        population strictly below the score).
+        """
+        if len(population) <= 1:
+            return [self._absolute_percentile(score) for score in scores]
+
+        if NUMPY_AVAILABLE:
+            ordered = np.sort(np.asarray(population, dtype=float))
+            positions = np.searchsorted(ordered, np.asarray(scores, dtype=float), side='left')
+            return (positions / len(ordered) * 100).tolist()
+
+        ordered = sorted(population)
+        return [bisect_left(ordered, score) / len(ordered) * 100 for score in scores]
+
     def _score_to_state(self, percentile: float,
                         suspicion_level: SuspicionLevel) -> ReputationState:
         """
@@ -763,27 +834,26 @@ class ReputationScorer:
     # Storage
     # =========================================================================
 
-    def _store_score(self, artist_id: int, wallet_address: str,
-                    twitter_handle: str, metrics: AuthenticityMetrics,
-                    vitality_score: float, network_score: float,
-                    transaction_score: float, timeline_score: float,
-                    weighted_score: float, percentile_rank: float,
-                    reputation_state: ReputationState,
-                    network_analysis: NetworkAnalysis):
-        """Store the calculated score"""
-        cursor = self.db_conn.cursor()
-
-        cursor.execute('''
-            INSERT OR REPLACE INTO reputation_scores_v2
-            (artist_id, twitter_handle, wallet_address, authenticity_metrics,
-             collector_vitality_score, network_authenticity_score,
-             transaction_legitimacy_score, timeline_health_score,
-             weighted_score, percentile_rank, reputation_state, suspicion_level,
-             sybil_clusters_found, circular_rings_found, dead_end_wallets_found,
-             wash_trade_indicators, verified_collectors_count, ecosystem_connections,
-             compared_against_count, scan_completed_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-        ''', (
+    _SCORE_COLUMNS = (
+        'artist_id', 'twitter_handle', 'wallet_address', 'authenticity_metrics',
+        'collector_vitality_score', 'network_authenticity_score',
+        'transaction_legitimacy_score', 'timeline_health_score',
+        'weighted_score', 'percentile_rank', 'reputation_state', 'suspicion_level',
+        'sybil_clusters_found', 'circular_rings_found', 'dead_end_wallets_found',
+        'wash_trade_indicators', 'verified_collectors_count', 'ecosystem_connections',
+        'compared_against_count',
+    )
+
+    def _score_row(self, artist_id: int, wallet_address: str,
+                   twitter_handle: str, metrics: AuthenticityMetrics,
+                   vitality_score: float, network_score: float,
+                   transaction_score: float, timeline_score: float,
+                   weighted_score: float, percentile_rank: float,
+                   reputation_state: ReputationState,
+                   network_analysis: NetworkAnalysis,
+                   compared_against: int) -> Tuple:
+        """Values for one reputation_scores_v2 row, in _SCORE_COLUMNS order"""
+        return (
             artist_id,
             twitter_handle,
             wallet_address,
@@ -807,24 +877,196 @@ class ReputationScorer:
             metrics.wash_trade_indicators,
             metrics.verified_real_collectors,
             metrics.ecosystem_connected_collectors,
-            self._get_comparison_context().get('total_artists_assessed', 0)
-        ))
+            compared_against
+        )
+
+    def _write_scores(self, rows: List[Tuple]):
+        """Insert/replace score rows and their distribution entries in one transaction"""
+        cursor = self.db_conn.cursor()
+
+        cursor.executemany(f'''
+            INSERT OR REPLACE INTO reputation_scores_v2
+            ({', '.join(self._SCORE_COLUMNS)}, scan_completed_at)
+            VALUES ({', '.join('?' * len(self._SCORE_COLUMNS))}, CURRENT_TIMESTAMP)
+        ''', rows)
 
         # Store for distribution tracking
-        for metric_name, score in [
-            ('collector_vitality', vitality_score),
-            ('network_authenticity', network_score),
-            ('transaction_legitimacy', transaction_score),
-            ('timeline_health', timeline_score),
-            ('weighted_score', weighted_score)
-        ]:
-            cursor.execute('''
-                INSERT INTO authenticity_distribution (metric_name, score_value)
-                VALUES (?, ?)
-            ''', (metric_name, score))
+        vitality, network, transaction, timeline, weighted = (
+            self._SCORE_COLUMNS.index(c) for c in (
+                'collector_vitality_score', 'network_authenticity_score',
+                'transaction_legitimacy_score', 'timeline_health_score', 'weighted_score'))
+        cursor.executemany('''
+            INSERT INTO authenticity_distribution (metric_name, score_value)
+            VALUES (?, ?)
+        ''', [
+            (metric_name, row[index])
+            for row in rows
+            for metric_name, index in [
+                ('collector_vitality', vitality),
+                ('network_authenticity', network),
+                ('transaction_legitimacy', transaction),
+                ('timeline_health', timeline),
+                ('weighted_score', weighted)
+            ]
+        ])
 
         self.db_conn.commit()
 
+    def _store_score(self, artist_id: int, wallet_address: str,
+                    twitter_handle: str, metrics: AuthenticityMetrics,
+                    vitality_score: float, network_score: float,
+                    transaction_score: float, timeline_score: float,
+                    weighted_score: float, percentile_rank: float,
+                    reputation_state: ReputationState,
+                    network_analysis: NetworkAnalysis):
+        """Store the calculated score"""
+        self._write_scores([self._score_row(
+            artist_id, wallet_address, twitter_handle, metrics,
+            vitality_score, network_score, transaction_score, timeline_score,
+            weighted_score, percentile_rank, reputation_state, network_analysis,
+            self._get_comparison_context().get('total_artists_assessed', 0)
+        )])
+
+    # =========================================================================
+    # Batch Assessment
+    # =========================================================================
+
+    def _load_batch_jobs(self, artist_ids: List[int] = None) -> List[Tuple]:
+        """
+        Collectors and transactions for every tracked address (or only
+        `artist_ids`), loaded with one grouped query each.
+
+        The selected ids go into a temp table that every query joins, so
+        scoring a few artists only reads their rows.
+
+        Returns:
+            [(artist_id, wallet_address, collector_addresses, transfers)]
+        """
+        conn = sqlite3.connect(str(BLOCKCHAIN_DB_PATH))
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+
+        cursor.execute('CREATE TEMP TABLE batch_artists (id INTEGER PRIMARY KEY)')
+        if artist_ids is None:
+            cursor.execute('INSERT INTO batch_artists (id) SELECT id FROM tracked_addresses')
+        else:
+            cursor.executemany('INSERT OR IGNORE INTO batch_artists (id) VALUES (?)',
+                               [(artist_id,) for artist_id in artist_ids])
+
+        cursor.execute('''
+            SELECT t.id, t.address
+            FROM batch_artists b
+            JOIN tracked_addresses t ON t.id = b.id
+            ORDER BY t.id
+        ''')
+        artists = [(row['id'], row['address']) for row in cursor.fetchall()]
+
+        collectors: Dict[int, List[str]] = {artist_id: [] for artist_id, _ in artists}
+        cursor.execute('''
+            SELECT DISTINCT m.address_id, c.collector_address
+            FROM batch_artists b
+            JOIN nft_mints m ON m.address_id = b.id
+            JOIN collectors c ON c.nft_mint_id = m.id
+        ''')
+        for row in cursor.fetchall():
+            collectors[row['address_id']].append(row['collector_address'])
+
+        transfers: Dict[int, List[Dict]] = {artist_id: [] for artist_id, _ in artists}
+        cursor.execute('''
+            SELECT x.address_id, x.from_address, x.to_address, x.value_native,
+                   x.block_timestamp, x.tx_type
+            FROM batch_artists b
+            JOIN transactions x ON x.address_id = b.id
+        ''')
+        for row in cursor.fetchall():
+            record = dict(row)
+            del record['address_id']
+            transfers[row['address_id']].append(record)
+
+        conn.close()
+
+        return [(artist_id, address, collectors[artist_id], transfers[artist_id])
+                for artist_id, address in artists]
+
+    def assess_all_artists(self, workers: int = None, artist_ids: List[int] = None) -> Dict:
+        """
+        Assess every tracked artist in one batch.
+
+        Wallet profiles are built once for the union of all collectors and
+        shared by every artist; network analyses run in a process pool;
+        percentiles are computed in one pass against the final population;
+        all score rows are written in a single transaction.
+
+        Args:
+            workers: Worker processes (default: CPU count; 1 runs inline)
+            artist_ids: Restrict to these tracked address ids
+
+        Returns:
+            Summary with counts, state distribution and artists/minute
+        """
+        started = time.perf_counter()
+        workers = workers or os.cpu_count() or 1
+
+        jobs = self._load_batch_jobs(artist_ids)
+        if not jobs:
+            return {'artists': 0, 'seconds': 0.0, 'artists_per_minute': 0.0, 'states': {}}
+
+        all_collectors = sorted({address for job in jobs for address in job[2]})
+        profile_analyzer = NetworkAuthenticityAnalyzer(str(BLOCKCHAIN_DB_PATH))
+        base_profiles = profile_analyzer.cached_profiles(all_collectors)
+        logger.info(f"Profiled {len(base_profiles)} collector wallets for {len(jobs)} artists")
+
+        if workers == 1 or len(jobs) == 1:
+            _init_batch_worker(str(BLOCKCHAIN_DB_PATH), base_profiles)
+            results = [_analyze_batch_artist(job) for job in jobs]
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker,
+                                     initargs=(str(BLOCKCHAIN_DB_PATH), base_profiles)) as pool:
+                chunksize = max(1, len(jobs) // (workers * 4))
+                results = list(pool.map(_analyze_batch_artist, jobs, chunksize=chunksize))
+
+        analyses = dict(results)
+        scored = {artist_id: self._score_analysis(analysis) for artist_id, analysis in analyses.items()}
+
+        # Percentiles against everyone already assessed plus this batch
+        cursor = self.db_conn.cursor()
+        cursor.execute('SELECT artist_id, twitter_handle, weighted_score FROM reputation_scores_v2')
+        existing = cursor.fetchall()
+        handles = {row['artist_id']: row['twitter_handle'] for row in existing}
+        population = [row['weighted_score'] for row in existing
+                      if row['artist_id'] not in scored and row['weighted_score'] is not None]
+        batch_ids = list(scored)
+        batch_scores = [scored[artist_id][5] for artist_id in batch_ids]
+        population.extend(batch_scores)
+        percentiles = dict(zip(batch_ids, self._percentiles(batch_scores, population)))
+
+        rows = []
+        states: Dict[str, int] = {}
+        wallets = {job[0]: job[1] for job in jobs}
+        for artist_id in batch_ids:
+            metrics, vitality, network, transaction, timeline, weighted = scored[artist_id]
+            state = self._score_to_state(percentiles[artist_id], analyses[artist_id].suspicion_level)
+            states[state.name] = states.get(state.name, 0) + 1
+            rows.append(self._score_row(
+                artist_id, wallets[artist_id], handles.get(artist_id), metrics,
+                vitality, network, transaction, timeline,
+                weighted, percentiles[artist_id], state, analyses[artist_id],
+                len(population)
+            ))
+
+        self._write_scores(rows)
+        profile_analyzer.store_analyses(list(analyses.values()))
+
+        elapsed = time.perf_counter() - started
+        return {
+            'artists': len(rows),
+            'collectors_profiled': len(base_profiles),
+            'workers': workers,
+            'seconds': round(elapsed, 2),
+            'artists_per_minute': round(len(rows) / elapsed * 60, 1) if elapsed else 0.0,
+            'states': states,
+        }
+
     def get_artist_badge(self, artist_id: int) -> Optional[Dict]:
         """Retrieve stored badge for an artist"""
         cursor = self.db_conn.cursor()
@@ -857,15 +1099,14 @@ class ReputationScorer:
         Returns a ReputationResult object with state, score, findings, and component_scores.
         """
         # Get blockchain data directly from database
-        db_path = Path(__file__).parent.parent.parent / 'db' / 'blockchain_tracking.db'
-        conn = sqlite3.connect(str(db_path))
+        conn = sqlite3.connect(str(BLOCKCHAIN_DB_PATH))
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
         # Find address_id
         cursor.execute(
-            'SELECT id FROM tracked_addresses WHERE LOWER(address) = LOWER(?)',
-            (wallet_address,)
+            'SELECT id FROM tracked_addresses WHERE address_norm = ?',
+            (normalize_address(wallet_address),)
         )
         addr_row = cursor.fetchone()
 
@@ -941,6 +1182,7 @@ Usage:
   python reputation_score.py test
   python reputation_score.py weights
   python reputation_score.py distribution
+  python reputation_score.py batch [workers]
 
 This version measures AUTHENTICITY, not volume:
   - Are collectors real or sybil wallets?
@@ -975,6 +1217,19 @@ This version measures AUTHENTICITY, not volume:
             print(f"  {metric.replace('_', ' ').title()}: {weight*100:.0f}%")
         print("\nThese weights prioritize REAL activity over volume.")
 
+    elif command == 'batch':
+        workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+        summary = scorer.assess_all_artists(workers=workers)
+
+        print("\nBatch Reputation Assessment:")
+        print("=" * 45)
+        print(f"  Artists assessed:    {summary['artists']}")
+        print(f"  Collectors profiled: {summary.get('collectors_profiled', 0)}")
+        print(f"  Time:                {summary['seconds']}s")
+        print(f"  Throughput:          {summary['artists_per_minute']} artists/minute")
+        for state, count in sorted(summary['states'].items()):
+            print(f"  {state}: {count}")
+
     elif command == 'distribution':
         cursor = scorer.db_conn.cursor()
         cursor.execute('''
@@ -680,6 +680,17 @@ def scan_status(job_id: str):
     })
 
 
+@scanning_bp.route('/scheduler', methods=['GET'])
+def scheduler_stats():
+    """Queue depth, throughput and rate-limit waits of the shared request scheduler."""
+    from collectors.request_scheduler import get_scheduler
+
+    return jsonify({
+        'success': True,
+        'scheduler': get_scheduler().get_stats()
+    })
+
+
 # =============================================================================
 # VISUALIZATION GENERATION
 # =============================================================================
@@ -165,6 +165,7 @@ def trigger_blockchain_scrape(address: str, network: str = 'ethereum', artist_fo
             """Run wallet scan in background thread"""
             try:
                 from collectors.wallet_scanner import WalletScanner
+                from collectors.request_scheduler import get_scheduler, INTERACTIVE
 
                 logger.info(f"Starting wallet scan for {address} (network: {network})")
 
@@ -197,8 +198,10 @@ def trigger_blockchain_scrape(address: str, network: str = 'ethereum', artist_fo
                     'networks': networks_to_scan
                 })
 
-                # Run the scan
-                results = scanner.scan_wallet(address, networks=networks_to_scan)
+                # Run the scan; the user is waiting on it, so it goes ahead
+                # of any background scans sharing the provider budgets
+                with get_scheduler().priority(INTERACTIVE):
+                    results = scanner.scan_wallet(address, networks=networks_to_scan)
 
                 # Get stats from results
                 combined_stats = results.get('combined_stats', {})
@@ -328,6 +331,7 @@ def _get_collectors_for_verification(artist_address: str) -> list:
     """
     import sqlite3
     from pathlib import Path
+    from collectors.blockchain_db import normalize_address
 
     collectors = []
     db_path = Path(__file__).parent.parent.parent / 'db' / 'blockchain_tracking.db'
@@ -342,11 +346,11 @@ def _get_collectors_for_verification(artist_address: str) -> list:
             SELECT ta.id, COUNT(m.id) as mint_count
             FROM tracked_addresses ta
             LEFT JOIN nft_mints m ON m.address_id = ta.id
-            WHERE LOWER(ta.address) = LOWER(?)
+            WHERE ta.address_norm = ?
             GROUP BY ta.id
             ORDER BY COUNT(m.id) DESC, ta.last_synced DESC NULLS LAST
             LIMIT 1
-        ''', (artist_address,))
+        ''', (normalize_address(artist_address),))
         addr_row = cursor.fetchone()
 
         if not addr_row:
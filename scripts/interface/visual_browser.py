@@ -4771,17 +4771,27 @@ def api_point_cloud_data():
     Return point cloud network data with temporal enrichment.
     Used by the temporal existence visualization.
     Merges blockchain data with knowledge base documents.
+
+    Level-of-detail mode (for networks too large to send whole):
+        ?lod=clusters[&limit=N][&cursor=C]          cluster summary nodes
+        ?lod=nodes&clusters=1,2[&limit=N][&cursor=C] member nodes, paged
+        &top_k=K                                    edges kept per node
+    Follow next_cursor until it is null; a 409 means the network changed
+    and paging must restart.
     """
     try:
         # Get blockchain network data
         blockchain_nodes = []
         blockchain_edges = []
+        snapshot_version = None
         try:
-            from collectors.network_data_builder import NetworkDataBuilder
-            builder = NetworkDataBuilder(include_temporal=True)
-            data = builder.build_from_database()
+            from collectors.network_snapshot import NetworkSnapshot
+            snapshot = NetworkSnapshot(include_temporal=True)
+            # Serve the current version; pending sync deltas are applied off-request
+            data = snapshot.get_served_data()
             blockchain_nodes = data.get('nodes', [])
             blockchain_edges = data.get('edges', [])
+            snapshot_version = data.get('metadata', {}).get('snapshot_version')
         except Exception as e:
             logger.warning(f"Could not load blockchain data: {e}")
 
@@ -4840,10 +4850,39 @@ def api_point_cloud_data():
         all_nodes = blockchain_nodes + kb_nodes
         all_edges = blockchain_edges + kb_edges
 
+        lod = request.args.get('lod')
+        if lod:
+            from collectors.network_lod import (
+                get_network_lod, CursorError, DEFAULT_PAGE_SIZE, DEFAULT_TOP_K)
+
+            kb_fingerprint = hashlib.md5(
+                '|'.join(sorted(n['id'] for n in kb_nodes)).encode()).hexdigest()[:8]
+            version = f"{snapshot_version}:{kb_fingerprint}"
+            network_lod = get_network_lod(
+                {'nodes': all_nodes, 'edges': all_edges}, version,
+                top_k=request.args.get('top_k', DEFAULT_TOP_K, type=int))
+
+            limit = request.args.get('limit', DEFAULT_PAGE_SIZE, type=int)
+            cursor = request.args.get('cursor')
+            try:
+                if lod == 'clusters':
+                    page = network_lod.cluster_view(limit=limit, cursor=cursor)
+                elif lod == 'nodes':
+                    clusters = request.args.get('clusters')
+                    cluster_ids = [int(c) for c in clusters.split(',') if c] if clusters else None
+                    page = network_lod.node_page(cluster_ids, limit=limit, cursor=cursor)
+                else:
+                    return jsonify({'success': False, 'error': f"Unknown lod mode: {lod}"}), 400
+            except CursorError as e:
+                return jsonify({'success': False, 'error': str(e)}), 409
+
+            return jsonify({'success': True, **page})
+
         return jsonify({
             'success': True,
             'nodes': all_nodes,
             'edges': all_edges,
+            'snapshot_version': snapshot_version,
             'stats': {
                 'total_nodes': len(all_nodes),
                 'total_edges': len(all_edges),
@@ -6567,14 +6606,14 @@ def _get_nft_id_from_contract_token(contract: str, token_id: str):
     Returns None if not found.
     """
     try:
-        from collectors.blockchain_db import get_db
+        from collectors.blockchain_db import get_db, normalize_address
         db = get_db()
         conn = db.get_connection()
         cursor = conn.cursor()
         cursor.execute('''
             SELECT id FROM nft_mints
-            WHERE contract_address = ? AND token_id = ?
-        ''', (contract, str(token_id)))
+            WHERE contract_address_norm = ? AND token_id = ?
+        ''', (normalize_address(contract), str(token_id)))
         result = cursor.fetchone()
         conn.close()
         return result['id'] if result else None
@@ -6670,14 +6709,14 @@ def api_nft_events(contract, token_id):
         # Get metadata from database to check for metadata-based events
         metadata = {}
         try:
-            from collectors.blockchain_db import get_db
+            from collectors.blockchain_db import get_db, normalize_address
             db = get_db()
             conn = db.get_connection()
             cursor = conn.cursor()
             cursor.execute('''
                 SELECT metadata_json FROM nft_mints
-                WHERE contract_address = ? AND token_id = ?
-            ''', (contract, str(token_id)))
+                WHERE contract_address_norm = ? AND token_id = ?
+            ''', (normalize_address(contract), str(token_id)))
             result = cursor.fetchone()
             conn.close()
             if result and result['metadata_json']:
@@ -7317,7 +7356,7 @@ def nft_temporal_detail(contract, token_id):
             FutureEventDetector,
             LiveWorkTracker
         )
-        from collectors.blockchain_db import get_db
+        from collectors.blockchain_db import get_db, normalize_address
 
         # Convert token_id to int
         try:
@@ -7333,8 +7372,8 @@ def nft_temporal_detail(contract, token_id):
             SELECT nm.*, ta.address, ta.label, ta.network
             FROM nft_mints nm
             LEFT JOIN tracked_addresses ta ON nm.address_id = ta.id
-            WHERE nm.contract_address = ? AND nm.token_id = ?
-        ''', (contract, str(token_id)))
+            WHERE nm.contract_address_norm = ? AND nm.token_id = ?
+        ''', (normalize_address(contract), str(token_id)))
         nft_row = cursor.fetchone()
         conn.close()
 
@@ -19,7 +19,6 @@ import json
 import re
 import logging
 import time
-import requests
 from typing import List, Dict, Optional, Set, Tuple
 from pathlib import Path
 from datetime import datetime
@@ -31,11 +30,15 @@ from collections import defaultdict
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from collectors.wallet_scanner import WalletScanner
+from collectors.request_scheduler import get_scheduler
 from minting.batch_wallet_scanner import BatchWalletScanner, NFTMint
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Seconds ENS / Tezos domain lookups stay in the shared response cache
+DOMAIN_CACHE_TTL = 3600
+
 
 @dataclass
 class SocialProfile:
@@ -172,9 +175,10 @@ class ENSResolver:
 
         # Fallback: Try ENS API
         try:
-            response = requests.get(
+            response = get_scheduler().get(
                 f"https://api.ensideas.com/ens/resolve/{domain}",
-                timeout=10
+                timeout=10,
+                cache_ttl=DOMAIN_CACHE_TTL
             )
             if response.status_code == 200:
                 data = response.json()
@@ -190,9 +194,10 @@ class ENSResolver:
     def reverse_resolve(self, address: str) -> Optional[str]:
         """Get ENS name for an address (reverse resolution)"""
         try:
-            response = requests.get(
+            response = get_scheduler().get(
                 f"https://api.ensideas.com/ens/resolve/{address}",
-                timeout=10
+                timeout=10,
+                cache_ttl=DOMAIN_CACHE_TTL
             )
             if response.status_code == 200:
                 data = response.json()
@@ -220,10 +225,11 @@ class TezosDomainsResolver:
             if not domain.endswith('.tez'):
                 domain += '.tez'
 
-            response = requests.get(
+            response = get_scheduler().get(
                 f"{self.TZKT_API}/domains",
                 params={'name': domain},
-                timeout=15
+                timeout=15,
+                cache_ttl=DOMAIN_CACHE_TTL
             )
 
             if response.status_code == 200:
@@ -243,10 +249,11 @@ class TezosDomainsResolver:
     def get_domains_for_address(self, address: str) -> List[str]:
         """Get all Tezos domains owned by an address"""
         try:
-            response = requests.get(
+            response = get_scheduler().get(
                 f"{self.TZKT_API}/domains",
                 params={'owner': address},
-                timeout=15
+                timeout=15,
+                cache_ttl=DOMAIN_CACHE_TTL
             )
 
             if response.status_code == 200:
@@ -309,7 +316,7 @@ class TwitterWalletFinder:
 
             for nitter_url in nitter_instances:
                 try:
-                    response = requests.get(nitter_url, timeout=10)
+                    response = get_scheduler().get(nitter_url, timeout=10)
                     if response.status_code == 200:
                         profile_text = response.text
 
@@ -325,14 +332,49 @@ class TwitterWalletFinder:
         except:
             pass
 
-        # Method 2: Check well-known NFT platforms for linked Twitter
-        try:
+        # Methods 2-4: NFT platforms that link a Twitter handle to wallets.
+        # The lookups are independent, so they go out as one concurrent batch.
+        sr_response, fnd_response, objkt_response = get_scheduler().fetch_many([
             # SuperRare API
-            sr_response = requests.get(
-                f"https://superrare.com/api/v2/user?username={username}",
-                timeout=10
-            )
-            if sr_response.status_code == 200:
+            {
+                'url': f"https://superrare.com/api/v2/user?username={username}",
+                'timeout': 10
+            },
+            # Foundation
+            {
+                'url': "https://api.foundation.app/graphql",
+                'json': {
+                    "query": """
+                        query GetUserByUsername($username: String!) {
+                            user(username: $username) {
+                                publicKey
+                            }
+                        }
+                    """,
+                    "variables": {"username": username}
+                },
+                'timeout': 10
+            },
+            # Objkt (Tezos)
+            {
+                'url': "https://api.objkt.com/v1/graphql",
+                'json': {
+                    "query": """
+                        query GetHolder($twitter: String!) {
+                            holder(where: {twitter: {_eq: $twitter}}) {
+                                address
+                            }
+                        }
+                    """,
+                    "variables": {"twitter": username}
+                },
+                'timeout': 10
+            },
+        ])
+
+        # Method 2: SuperRare
+        try:
+            if not isinstance(sr_response, Exception) and sr_response.status_code == 200:
                 data = sr_response.json()
                 if data.get('ethAddress'):
                     result['wallets'].append({
@@ -346,21 +388,7 @@ class TwitterWalletFinder:
 
         # Method 3: Foundation
         try:
-            fnd_response = requests.get(
-                f"https://api.foundation.app/graphql",
-                json={
-                    "query": """
-                        query GetUserByUsername($username: String!) {
-                            user(username: $username) {
-                                publicKey
-                            }
-                        }
-                    """,
-                    "variables": {"username": username}
-                },
-                timeout=10
-            )
-            if fnd_response.status_code == 200:
+            if not isinstance(fnd_response, Exception) and fnd_response.status_code == 200:
                 data = fnd_response.json()
                 pk = data.get('data', {}).get('user', {}).get('publicKey')
                 if pk:
@@ -375,21 +403,7 @@ class TwitterWalletFinder:
 
         # Method 4: Objkt (Tezos)
         try:
-            objkt_response = requests.get(
-                f"https://api.objkt.com/v1/graphql",
-                json={
-                    "query": """
-                        query GetHolder($twitter: String!) {
-                            holder(where: {twitter: {_eq: $twitter}}) {
-                                address
-                            }
-                        }
-                    """,
-                    "variables": {"twitter": username}
-                },
-                timeout=10
-            )
-            if objkt_response.status_code == 200:
+            if not isinstance(objkt_response, Exception) and objkt_response.status_code == 200:
                 data = objkt_response.json()
                 holders = data.get('data', {}).get('holder', [])
                 for holder in holders:
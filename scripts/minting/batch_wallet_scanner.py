@@ -22,14 +22,14 @@ import hashlib
 from typing import List, Dict, Optional, Set
 from pathlib import Path
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, asdict
 
 # Add parent path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from collectors.wallet_scanner import WalletScanner
-from collectors.blockchain_db import get_db
+from collectors.blockchain_db import get_db, normalize_address
+from collectors.request_scheduler import get_scheduler, BACKGROUND
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -88,17 +88,23 @@ class BatchWalletScanner:
         ])
     """
 
-    def __init__(self, max_workers: int = 5):
+    def __init__(self, max_workers: int = 5, priority: int = BACKGROUND):
         """
         Initialize batch scanner
 
         Args:
-            max_workers: Max parallel scans (be careful with rate limits)
+            max_workers: Max wallets of this batch in flight at once
+            priority: Scheduler priority for this batch's scans (and their requests)
         """
         self.scanner = WalletScanner()
         self.max_workers = max_workers
+        self.priority = priority
         self.db = get_db()
 
+        # Shared job pool and provider budgets; rate limits are enforced
+        # per provider across every scanner in the process
+        self.scheduler = get_scheduler()
+
         # Track all unique mints
         self.all_mints: Set[NFTMint] = set()
         self.all_collectors: Dict[str, Dict] = {}
@@ -219,7 +225,7 @@ class BatchWalletScanner:
 
         Args:
             addresses: List of wallet addresses (any chain)
-            parallel: Use parallel scanning (faster but watch rate limits)
+            parallel: Scan through the shared scheduler (rate limits are enforced there)
             progress_callback: Optional callback(completed, total, address)
 
         Returns:
@@ -232,46 +238,45 @@ class BatchWalletScanner:
         completed = 0
 
         if parallel and len(addresses) > 1:
-            # Parallel scanning
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                future_to_addr = {
-                    executor.submit(self.scan_single_wallet, addr): addr
-                    for addr in addresses
-                }
+            # Parallel scanning on the shared scheduler pool
+            jobs = self.scheduler.map_unordered(
+                self.scan_single_wallet, addresses,
+                priority=self.priority, max_in_flight=self.max_workers
+            )
+
+            for addr, future in jobs:
+                try:
+                    result = future.result()
+                    results.append(result)
+
+                    # Add mints to global set
+                    for mint in result.mints:
+                        self.all_mints.add(mint)
+
+                    # Track collectors
+                    for collector in result.collectors:
+                        coll_addr = collector.get('address', '')
+                        if coll_addr not in self.all_collectors:
+                            self.all_collectors[coll_addr] = collector
+                        else:
+                            # Merge collector data
+                            existing = self.all_collectors[coll_addr]
+                            existing['total_pieces'] = existing.get('total_pieces', 0) + collector.get('total_pieces', 0)
+
+                    completed += 1
+                    if progress_callback:
+                        progress_callback(completed, len(addresses), addr)
+
+                    logger.info(f"[{completed}/{len(addresses)}] Scanned {addr[:16]}... - Found {len(result.mints)} mints")
 
-                for future in as_completed(future_to_addr):
-                    addr = future_to_addr[future]
-                    try:
-                        result = future.result()
-                        results.append(result)
-
-                        # Add mints to global set
-                        for mint in result.mints:
-                            self.all_mints.add(mint)
-
-                        # Track collectors
-                        for collector in result.collectors:
-                            coll_addr = collector.get('address', '')
-                            if coll_addr not in self.all_collectors:
-                                self.all_collectors[coll_addr] = collector
-                            else:
-                                # Merge collector data
-                                existing = self.all_collectors[coll_addr]
-                                existing['total_pieces'] = existing.get('total_pieces', 0) + collector.get('total_pieces', 0)
-
-                        completed += 1
-                        if progress_callback:
-                            progress_callback(completed, len(addresses), addr)
-
-                        logger.info(f"[{completed}/{len(addresses)}] Scanned {addr[:16]}... - Found {len(result.mints)} mints")
-
-                    except Exception as e:
-                        logger.error(f"Failed to get result for {addr}: {e}")
-                        completed += 1
+                except Exception as e:
+                    logger.error(f"Failed to get result for {addr}: {e}")
+                    completed += 1
         else:
             # Sequential scanning
             for addr in addresses:
-                result = self.scan_single_wallet(addr)
+                with self.scheduler.priority(self.priority):
+                    result = self.scan_single_wallet(addr)
                 results.append(result)
 
                 for mint in result.mints:
@@ -299,6 +304,10 @@ class BatchWalletScanner:
         logger.info(f"  Unique collectors: {len(self.all_collectors)}")
         logger.info(f"  Total time: {total_time:.1f}s")
 
+        jobs = self.scheduler.get_stats()['jobs']
+        logger.info(f"  Scheduler: {jobs['queue_depth']} queued, {jobs['running']} running, "
+                    f"{jobs['jobs_per_minute']} jobs/min")
+
         return aggregated
 
     def _aggregate_results(self, results: List[ScanResult], total_time: float) -> Dict:
@@ -429,11 +438,11 @@ class BatchWalletScanner:
                     (address_id, token_id, contract_address, mint_tx_hash,
                      mint_block_number, token_uri, name, description, platform)
                     VALUES (
-                        (SELECT id FROM tracked_addresses WHERE LOWER(address) = LOWER(?)),
+                        (SELECT id FROM tracked_addresses WHERE address_norm = ?),
                         ?, ?, ?, ?, ?, ?, ?, ?
                     )
                 ''', (
-                    mint['minter_address'],
+                    normalize_address(mint['minter_address']),
                     mint['token_id'],
                     mint['contract_address'],
                     mint['tx_hash'],
@@ -16,12 +16,17 @@ import sys
 import json
 import time
 import logging
-import requests
 from typing import List, Dict, Optional, Set
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, asdict, field
 
+# Add parent path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from collectors.request_scheduler import get_scheduler
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -87,7 +92,7 @@ class AlchemyNFTScanner:
                 if page_key:
                     params['pageKey'] = page_key
 
-                response = requests.get(url, params=params, timeout=30)
+                response = get_scheduler().get(url, params=params, timeout=30)
 
                 if response.status_code == 200:
                     data = response.json()
@@ -159,7 +164,7 @@ class AlchemyNFTScanner:
                 if page_key:
                     payload["params"][0]["pageKey"] = page_key
 
-                response = requests.post(url, json=payload, timeout=60)
+                response = get_scheduler().post(url, json=payload, timeout=60)
 
                 if response.status_code == 200:
                     data = response.json()
@@ -218,7 +223,7 @@ class AlchemyNFTScanner:
                 if page_key:
                     params['pageKey'] = page_key
 
-                response = requests.get(url, params=params, timeout=30)
+                response = get_scheduler().get(url, params=params, timeout=30)
 
                 if response.status_code == 200:
                     data = response.json()
@@ -275,7 +280,7 @@ class ReservoirScanner:
                 if continuation:
                     params['continuation'] = continuation
 
-                response = requests.get(url, params=params, headers=self.headers, timeout=30)
+                response = get_scheduler().get(url, params=params, headers=self.headers, timeout=30)
 
                 if response.status_code == 200:
                     data = response.json()
@@ -329,7 +334,7 @@ class ReservoirScanner:
                 if continuation:
                     params['continuation'] = continuation
 
-                response = requests.get(url, params=params, headers=self.headers, timeout=30)
+                response = get_scheduler().get(url, params=params, headers=self.headers, timeout=30)
 
                 if response.status_code == 200:
                     data = response.json()
@@ -410,7 +415,7 @@ class SimpleHashScanner:
                 if cursor:
                     params['cursor'] = cursor
 
-                response = requests.get(url, params=params, headers=self.headers, timeout=30)
+                response = get_scheduler().get(url, params=params, headers=self.headers, timeout=30)
 
                 if response.status_code == 200:
                     data = response.json()
@@ -486,17 +491,31 @@ class UnifiedNFTScanner:
             logger.info(f"Using Alchemy API for {network}...")
             result['source'] = 'alchemy'
 
-            # Get owned NFTs
-            result['owned_nfts'] = self.alchemy.get_nfts_for_owner(address, network)
-            logger.info(f"  Found {len(result['owned_nfts'])} owned NFTs")
+            # Owned NFTs, mints and sales are independent paginated
+            # streams; page through them concurrently. They run on a
+            # private executor rather than the scheduler's job pool, since
+            # scan_wallet itself may be a pool job and must not block on
+            # other jobs. Requests still draw on the provider budgets.
+            scheduler = get_scheduler()
+            priority = scheduler.current_priority
+
+            def fetch(stream):
+                with scheduler.priority(priority):
+                    return stream(address, network)
+
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                owned = executor.submit(fetch, self.alchemy.get_nfts_for_owner)
+                minted = executor.submit(fetch, self.alchemy.get_minted_nfts)
+                sales = executor.submit(fetch, self.alchemy.get_nft_sales)
+
+                result['owned_nfts'] = owned.result()
+                logger.info(f"  Found {len(result['owned_nfts'])} owned NFTs")
 
-            # Get mints
-            result['minted_nfts'] = self.alchemy.get_minted_nfts(address, network)
-            logger.info(f"  Found {len(result['minted_nfts'])} mints")
+                result['minted_nfts'] = minted.result()
+                logger.info(f"  Found {len(result['minted_nfts'])} mints")
 
-            # Get sales
-            result['sales'] = self.alchemy.get_nft_sales(address, network)
-            logger.info(f"  Found {len(result['sales'])} sales")
+                result['sales'] = sales.result()
+                logger.info(f"  Found {len(result['sales'])} sales")
 
             return result
 
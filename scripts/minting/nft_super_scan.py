@@ -31,12 +31,13 @@ from pathlib import Path
 from datetime import datetime
 from dataclasses import dataclass, field, asdict
 from collections import defaultdict
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Add parent path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from collectors.wallet_scanner import WalletScanner
+from collectors.request_scheduler import get_scheduler, BACKGROUND
+from collectors.taste_engine import TasteMatrix
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -144,17 +145,22 @@ class NFTSuperScanner:
     to build a complete network map of the collector ecosystem.
     """
 
-    def __init__(self, max_workers: int = 3, scan_depth: int = 2):
+    def __init__(self, max_workers: int = 3, scan_depth: int = 2, priority: int = BACKGROUND):
         """
         Initialize SUPER SCAN
 
         Args:
-            max_workers: Parallel scan workers
+            max_workers: Max wallet scans of this run in flight at once
             scan_depth: How deep to recurse (1=collectors only, 2=collector holdings, 3+=related artist collectors)
+            priority: Scheduler priority for this run's scans (and their requests)
         """
         self.scanner = WalletScanner()
         self.max_workers = max_workers
         self.scan_depth = scan_depth
+        self.priority = priority
+
+        # Shared job pool; provider rate limits are enforced there
+        self.scheduler = get_scheduler()
 
         # Caches
         self.scanned_addresses: Set[str] = set()
@@ -220,42 +226,49 @@ class NFTSuperScanner:
         all_mints = []
         all_collectors_raw = []
 
+        # Every (wallet, network) pair is an independent job on the shared pool
+        wallet_networks = []
         for wallet in artist_wallets:
             logger.info(f"  Scanning wallet: {wallet[:16]}...")
+            wallet_networks.extend(
+                (wallet, network)
+                for network in self.scanner.detect_all_networks(wallet)
+                if network in ('ethereum', 'tezos', 'polygon')
+            )
 
-            networks = self.scanner.detect_all_networks(wallet)
+        wallet_results = {
+            pair: future
+            for pair, future in self.scheduler.map_unordered(
+                self._scan_artist_wallet, wallet_networks,
+                priority=self.priority, max_in_flight=self.max_workers
+            )
+        }
 
-            for network in networks:
-                try:
-                    if network == 'ethereum':
-                        scan_result = self.scanner.scan_ethereum_wallet(wallet)
-                    elif network == 'tezos':
-                        scan_result = self.scanner.scan_tezos_wallet(wallet)
-                    elif network == 'polygon':
-                        scan_result = self.scanner.scan_polygon_wallet(wallet)
-                    else:
-                        continue
+        # Merge in submission order so output does not depend on timing
+        for wallet, network in wallet_networks:
+            try:
+                scan_result = wallet_results[(wallet, network)].result()
 
-                    mints = scan_result.get('minted_nfts', [])
-                    collectors = scan_result.get('collectors', [])
+                mints = scan_result.get('minted_nfts', [])
+                collectors = scan_result.get('collectors', [])
 
-                    # Tag mints with artist info
-                    for mint in mints:
-                        mint['artist_wallet'] = wallet
-                        mint['network'] = network
+                # Tag mints with artist info
+                for mint in mints:
+                    mint['artist_wallet'] = wallet
+                    mint['network'] = network
 
-                        # Map contract to artist
-                        contract = mint.get('contract_address', '')
-                        if contract:
-                            self.contract_to_artist[contract.lower()] = wallet
+                    # Map contract to artist
+                    contract = mint.get('contract_address', '')
+                    if contract:
+                        self.contract_to_artist[contract.lower()] = wallet
 
-                    all_mints.extend(mints)
-                    all_collectors_raw.extend(collectors)
+                all_mints.extend(mints)
+                all_collectors_raw.extend(collectors)
 
-                    logger.info(f"    {network}: {len(mints)} mints, {len(collectors)} collectors")
+                logger.info(f"    {network}: {len(mints)} mints, {len(collectors)} collectors")
 
-                except Exception as e:
-                    logger.warning(f"    Error scanning {network}: {e}")
+            except Exception as e:
+                logger.warning(f"    Error scanning {wallet[:16]} on {network}: {e}")
 
         # Aggregate mint stats
         result.total_mints = len(all_mints)
@@ -324,6 +337,7 @@ class NFTSuperScanner:
         # ═══════════════════════════════════════════════════════════════
         # PHASE 3: Deep scan collector holdings
         # ═══════════════════════════════════════════════════════════════
+        taste_matrix = None
         if scan_collector_holdings and self.scan_depth >= 2:
             logger.info("\nPHASE 3: Deep scanning collector holdings...")
 
@@ -331,48 +345,44 @@ class NFTSuperScanner:
             collectors_to_scan = collectors_sorted[:max_collectors]
 
             other_artists_count: Dict[str, int] = defaultdict(int)
-            other_contracts_count: Dict[str, int] = defaultdict(int)
+            artist_contracts = {m.get('contract_address', '').lower() for m in all_mints}
 
             scanned = 0
 
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                future_to_collector = {
-                    executor.submit(self._scan_collector_holdings, c.address): c
-                    for c in collectors_to_scan
-                    if c.address.lower() not in self.scanned_addresses
-                }
-
-                for future in as_completed(future_to_collector):
-                    collector = future_to_collector[future]
+            jobs = self.scheduler.map_unordered(
+                lambda c: self._scan_collector_holdings(c.address),
+                [c for c in collectors_to_scan if c.address.lower() not in self.scanned_addresses],
+                priority=self.priority, max_in_flight=self.max_workers
+            )
 
-                    try:
-                        holdings = future.result()
+            for collector, future in jobs:
+                try:
+                    holdings = future.result()
 
-                        if holdings:
-                            collector.total_nfts_owned = len(holdings)
+                    if holdings:
+                        collector.total_nfts_owned = len(holdings)
 
-                            # Find other artists/contracts
-                            for nft in holdings:
-                                contract = nft.get('contract_address', '').lower()
+                        # Find other artists/contracts
+                        for nft in holdings:
+                            contract = nft.get('contract_address', '').lower()
 
-                                if contract and contract not in [c.lower() for m in all_mints for c in [m.get('contract_address', '')]]:
-                                    collector.other_contracts.append(contract)
-                                    other_contracts_count[contract] += 1
+                            if contract and contract not in artist_contracts:
+                                collector.other_contracts.append(contract)
 
-                                    # Try to identify artist
-                                    if contract in self.contract_to_artist:
-                                        artist = self.contract_to_artist[contract]
-                                        collector.other_artists.append(artist)
-                                        other_artists_count[artist] += 1
+                                # Try to identify artist
+                                if contract in self.contract_to_artist:
+                                    artist = self.contract_to_artist[contract]
+                                    collector.other_artists.append(artist)
+                                    other_artists_count[artist] += 1
 
-                            self.collector_holdings[collector.address] = holdings
+                        self.collector_holdings[collector.address] = holdings
 
-                        scanned += 1
-                        if scanned % 10 == 0:
-                            logger.info(f"    Scanned {scanned}/{len(collectors_to_scan)} collectors")
+                    scanned += 1
+                    if scanned % 10 == 0:
+                        logger.info(f"    Scanned {scanned}/{len(collectors_to_scan)} collectors")
 
-                    except Exception as e:
-                        logger.warning(f"    Error scanning {collector.address[:16]}: {e}")
+                except Exception as e:
+                    logger.warning(f"    Error scanning {collector.address[:16]}: {e}")
 
             logger.info(f"  Scanned {scanned} collector holdings")
 
@@ -381,15 +391,16 @@ class NFTSuperScanner:
             # ═══════════════════════════════════════════════════════════════
             logger.info("\nPHASE 4: Identifying related artists...")
 
-            # Find most common other contracts (potential related artists)
-            top_contracts = sorted(
-                other_contracts_count.items(),
-                key=lambda x: x[1],
-                reverse=True
-            )[:50]
+            # Collector x contract matrix of everything the scanned collectors hold
+            taste_matrix = self._taste_matrix(collectors_to_scan)
+
+            # Most co-collected other contracts (potential related artists),
+            # counted in distinct collectors
+            top_contracts = taste_matrix.top_contracts(50)
+            affinity = taste_matrix.contract_affinity([c for c, _ in top_contracts])
 
             result.top_shared_artists = [
-                {'contract': c, 'shared_collectors': count}
+                {'contract': c, 'shared_collectors': count, 'similar_contracts': affinity.get(c, [])}
                 for c, count in top_contracts
             ]
 
@@ -398,11 +409,7 @@ class NFTSuperScanner:
             # Build artist connections
             for contract, shared_count in top_contracts[:20]:
                 if shared_count >= 2:  # At least 2 shared collectors
-                    # Find which collectors share this
-                    shared_collectors = [
-                        c.address for c in collectors_sorted
-                        if contract in [cc.lower() for cc in c.other_contracts]
-                    ]
+                    shared_collectors = taste_matrix.holders(contract)
 
                     connection = ArtistConnection(
                         artist1=artist_name,
@@ -420,7 +427,7 @@ class NFTSuperScanner:
         # ═══════════════════════════════════════════════════════════════
         logger.info("\nPHASE 5: Analyzing taste clusters...")
 
-        result.taste_clusters = self._identify_taste_clusters(collectors_sorted[:max_collectors])
+        result.taste_clusters = self._identify_taste_clusters(collectors_sorted[:max_collectors], taste_matrix)
 
         logger.info(f"  Identified {len(result.taste_clusters)} taste clusters")
 
@@ -482,6 +489,15 @@ class NFTSuperScanner:
 
         return result
 
+    def _scan_artist_wallet(self, wallet_network: Tuple[str, str]) -> Dict:
+        """Scan one artist wallet on one network (a scheduler job)"""
+        wallet, network = wallet_network
+        if network == 'ethereum':
+            return self.scanner.scan_ethereum_wallet(wallet)
+        elif network == 'tezos':
+            return self.scanner.scan_tezos_wallet(wallet)
+        return self.scanner.scan_polygon_wallet(wallet)
+
     def _scan_collector_holdings(self, address: str) -> List[Dict]:
         """Scan what a collector owns"""
         self.scanned_addresses.add(address.lower())
@@ -508,51 +524,38 @@ class NFTSuperScanner:
             logger.debug(f"Error scanning collector {address[:16]}: {e}")
             return []
 
-    def _identify_taste_clusters(self, collectors: List[CollectorNode]) -> List[TasteCluster]:
+    @staticmethod
+    def _taste_matrix(collectors: List[CollectorNode]) -> TasteMatrix:
+        """Collector x contract incidence of the collectors' other holdings"""
+        return TasteMatrix({c.address: [cc.lower() for cc in c.other_contracts] for c in collectors})
+
+    def _identify_taste_clusters(self, collectors: List[CollectorNode],
+                                 taste_matrix: TasteMatrix = None) -> List[TasteCluster]:
         """
         Identify groups of collectors with similar taste
 
-        Uses simple overlap-based clustering
+        Collectors are linked by Jaccard similarity of what else they
+        collect (sparse co-collection counts, see TasteMatrix) and grouped
+        by community detection. Also sets each collector's taste_score.
         """
-        clusters = []
+        if taste_matrix is None:
+            taste_matrix = self._taste_matrix(collectors)
 
-        # Group collectors by what they own
-        contract_to_collectors: Dict[str, Set[str]] = defaultdict(set)
+        found, taste_scores = taste_matrix.taste_clusters()
 
         for collector in collectors:
-            for contract in collector.other_contracts:
-                contract_to_collectors[contract].add(collector.address)
-
-        # Find clusters where multiple collectors share same contracts
-        processed = set()
-        cluster_id = 0
-
-        for contract, coll_set in contract_to_collectors.items():
-            if len(coll_set) >= 3:  # At least 3 collectors
-                # Check if this forms a new cluster
-                key = frozenset(coll_set)
-                if key not in processed:
-                    processed.add(key)
-
-                    # Find common contracts for this group
-                    common_contracts = []
-                    for c, collectors_in_c in contract_to_collectors.items():
-                        if coll_set.issubset(collectors_in_c) or len(coll_set & collectors_in_c) >= len(coll_set) * 0.5:
-                            common_contracts.append(c)
-
-                    cluster = TasteCluster(
-                        cluster_id=f"cluster_{cluster_id}",
-                        collectors=list(coll_set),
-                        common_artists=common_contracts[:10],
-                        size=len(coll_set)
-                    )
-                    clusters.append(cluster)
-                    cluster_id += 1
-
-        # Sort by size
-        clusters.sort(key=lambda x: x.size, reverse=True)
-
-        return clusters[:10]  # Top 10 clusters
+            collector.taste_score = round(taste_scores.get(collector.address, 0.0), 4)
+
+        return [
+            TasteCluster(
+                cluster_id=f"cluster_{cluster_id}",
+                collectors=cluster['collectors'],
+                common_artists=cluster['common_contracts'][:10],
+                defining_traits=[f"cohesion {cluster['cohesion']:.2f}"],
+                size=len(cluster['collectors'])
+            )
+            for cluster_id, cluster in enumerate(found)
+        ]
 
     def export_results(self, result: SuperScanResult, output_dir: Path) -> Dict[str, Path]:
         """Export SUPER SCAN results"""
@@ -35,6 +35,7 @@ from .stage6_crossref import Stage6CrossRef, CrossRefError
 from .stage7_index import Stage7Index, IndexError
 from .stage8_present import Stage8Present, PresentError
 from .orchestrator import PipelineOrchestrator
+from .catalog import ResultCatalog
 from .spiral_compression import (
     SpiralCompressor,
     SpiralArchiveManager,
@@ -70,6 +71,7 @@ __all__ = [
     'Stage8Present',
     # Orchestrator
     'PipelineOrchestrator',
+    'ResultCatalog',
     # Errors
     'IngestError',
     'TranscribeError',
@@ -0,0 +1,250 @@
+"""
+DOC-8 Agent Analysis Pipeline - Result Catalog
+
+Lightweight SQLite catalog of processed results:
+- One summary row per source (what list views need)
+- segment_id -> source_id map for direct segment lookup
+
+Maintained by PipelineOrchestrator whenever a result JSON is written, so
+Stage8Present can page through sources and resolve segments without
+opening every result file. Results written before the catalog existed are
+indexed once by a full rebuild, tracked by the persisted 'backfilled' flag.
+"""
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import Dict, Optional, Any
+
+
+# Summary fields copied from a result JSON into the catalog
+SUMMARY_FIELDS = (
+    'source_id', 'title', 'author', 'source_type', 'status', 'duration',
+    'segment_count', 'speaker_count', 'imported_date', 'thumbnail',
+)
+
+
+class ResultCatalog:
+    """Indexed summary of pipeline results stored next to results/"""
+
+    def __init__(self, storage_dir: str = None):
+        """
+        Initialize result catalog.
+
+        Args:
+            storage_dir: Base storage directory for pipeline data
+        """
+        self.storage_dir = Path(storage_dir or '~/.arc8/pipeline').expanduser()
+        self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.storage_dir / 'catalog.db'
+        self._init_db()
+
+    def _init_db(self):
+        """Create catalog tables"""
+        conn = sqlite3.connect(self.db_path)
+        conn.executescript('''
+            CREATE TABLE IF NOT EXISTS sources (
+                source_id TEXT PRIMARY KEY,
+                title TEXT,
+                author TEXT,
+                source_type TEXT,
+                status TEXT,
+                duration REAL,
+                segment_count INTEGER DEFAULT 0,
+                speaker_count INTEGER DEFAULT 0,
+                imported_date TEXT,
+                thumbnail TEXT,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            );
+
+            CREATE TABLE IF NOT EXISTS segments (
+                segment_id TEXT PRIMARY KEY,
+                source_id TEXT NOT NULL
+            ) WITHOUT ROWID;
+
+            CREATE TABLE IF NOT EXISTS catalog_meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            ) WITHOUT ROWID;
+
+            CREATE INDEX IF NOT EXISTS idx_catalog_imported ON sources(imported_date);
+            CREATE INDEX IF NOT EXISTS idx_catalog_type ON sources(source_type, imported_date);
+            CREATE INDEX IF NOT EXISTS idx_catalog_status ON sources(status, imported_date);
+            CREATE INDEX IF NOT EXISTS idx_catalog_segment_source ON segments(source_id);
+        ''')
+        conn.commit()
+        conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    @staticmethod
+    def summarize(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the catalog summary row for a result JSON dict"""
+        return {
+            'source_id': data['source_id'],
+            'title': data.get('title') or 'Untitled',
+            'author': data.get('author'),
+            'source_type': data.get('source_type'),
+            'status': data.get('status'),
+            'duration': data.get('duration'),
+            'segment_count': data.get('segment_count', len(data.get('segments', []))),
+            'speaker_count': data.get('speaker_count', 0),
+            'imported_date': data.get('imported_date'),
+            'thumbnail': data.get('thumbnail_path'),
+        }
+
+    def record(self, data: Dict[str, Any], conn: sqlite3.Connection = None):
+        """
+        Add or replace a result in the catalog.
+
+        Args:
+            data: Result dict as written to results/<source_id>.json
+            conn: Optional open connection (caller commits)
+        """
+        own_conn = conn is None
+        if own_conn:
+            conn = self._connect()
+
+        summary = self.summarize(data)
+        columns = ', '.join(SUMMARY_FIELDS)
+        placeholders = ', '.join('?' * len(SUMMARY_FIELDS))
+        conn.execute(
+            f'INSERT OR REPLACE INTO sources ({columns}) VALUES ({placeholders})',
+            [summary[field] for field in SUMMARY_FIELDS])
+
+        conn.execute('DELETE FROM segments WHERE source_id = ?', (summary['source_id'],))
+        conn.executemany(
+            'INSERT OR REPLACE INTO segments (segment_id, source_id) VALUES (?, ?)',
+            [(seg['segment_id'], summary['source_id'])
+             for seg in data.get('segments', []) if seg.get('segment_id')])
+
+        if own_conn:
+            conn.commit()
+            conn.close()
+
+    def remove(self, source_id: str):
+        """Remove a source and its segments from the catalog"""
+        conn = self._connect()
+        conn.execute('DELETE FROM segments WHERE source_id = ?', (source_id,))
+        conn.execute('DELETE FROM sources WHERE source_id = ?', (source_id,))
+        conn.commit()
+        conn.close()
+
+    def rebuild(self, results_dir: Path) -> int:
+        """
+        Rebuild the catalog from result files on disk.
+
+        Returns:
+            Number of results catalogued
+        """
+        conn = self._connect()
+        conn.execute('DELETE FROM segments')
+        conn.execute('DELETE FROM sources')
+
+        count = 0
+        for result_file in Path(results_dir).glob('*.json'):
+            try:
+                with open(result_file) as f:
+                    data = json.load(f)
+                self.record(data, conn=conn)
+                count += 1
+            except (json.JSONDecodeError, KeyError):
+                continue
+
+        self._set_meta(conn, 'backfilled', '1')
+        conn.commit()
+        conn.close()
+        return count
+
+    @staticmethod
+    def _set_meta(conn: sqlite3.Connection, key: str, value: str):
+        conn.execute('INSERT OR REPLACE INTO catalog_meta (key, value) VALUES (?, ?)',
+                     (key, value))
+
+    def is_backfilled(self) -> bool:
+        """Whether result files on disk have been fully catalogued once"""
+        conn = self._connect()
+        row = conn.execute(
+            "SELECT value FROM catalog_meta WHERE key = 'backfilled'").fetchone()
+        conn.close()
+        return row is not None and row['value'] == '1'
+
+    def mark_backfilled(self):
+        """Record that there is nothing left to backfill"""
+        conn = self._connect()
+        self._set_meta(conn, 'backfilled', '1')
+        conn.commit()
+        conn.close()
+
+    def is_empty(self) -> bool:
+        conn = self._connect()
+        row = conn.execute('SELECT 1 FROM sources LIMIT 1').fetchone()
+        conn.close()
+        return row is None
+
+    def list_sources(self, limit: int, offset: int = 0,
+                     source_type: str = None, status: str = None) -> Dict:
+        """
+        Page through source summaries, newest first.
+
+        Returns:
+            {sources: [...], total: int}
+        """
+        where = []
+        params: list = []
+        if source_type:
+            where.append('source_type = ?')
+            params.append(source_type)
+        if status:
+            where.append('status = ?')
+            params.append(status)
+        where_sql = f"WHERE {' AND '.join(where)}" if where else ''
+
+        conn = self._connect()
+        total = conn.execute(f'SELECT COUNT(*) FROM sources {where_sql}', params).fetchone()[0]
+        rows = conn.execute(f'''
+            SELECT {', '.join(SUMMARY_FIELDS)} FROM sources {where_sql}
+            ORDER BY COALESCE(imported_date, '') DESC
+            LIMIT ? OFFSET ?
+        ''', params + [limit, offset]).fetchall()
+        conn.close()
+
+        return {'sources': [dict(row) for row in rows], 'total': total}
+
+    def get_source_id_for_segment(self, segment_id: str) -> Optional[str]:
+        """Resolve which source a segment belongs to"""
+        conn = self._connect()
+        row = conn.execute(
+            'SELECT source_id FROM segments WHERE segment_id = ?', (segment_id,)).fetchone()
+        conn.close()
+        return row['source_id'] if row else None
+
+    def get_stats(self) -> Dict:
+        """Aggregate counts across all catalogued sources"""
+        conn = self._connect()
+        totals = conn.execute('''
+            SELECT COUNT(*) AS total_sources,
+                   COALESCE(SUM(segment_count), 0) AS total_segments,
+                   COALESCE(SUM(duration), 0) AS total_duration
+            FROM sources
+        ''').fetchone()
+        by_type = conn.execute('''
+            SELECT COALESCE(source_type, 'unknown') AS key, COUNT(*) AS n
+            FROM sources GROUP BY key
+        ''').fetchall()
+        by_status = conn.execute('''
+            SELECT COALESCE(status, 'unknown') AS key, COUNT(*) AS n
+            FROM sources GROUP BY key
+        ''').fetchall()
+        conn.close()
+
+        return {
+            'total_sources': totals['total_sources'],
+            'total_segments': totals['total_segments'],
+            'total_duration': totals['total_duration'],
+            'by_type': {row['key']: row['n'] for row in by_type},
+            'by_status': {row['key']: row['n'] for row in by_status},
+        }
@@ -198,13 +198,16 @@ class PipelineOrchestrator:
         return results
 
     def _save_result(self, source: Source):
-        """Save processed source result"""
+        """Save processed source result and update the result catalog"""
         results_dir = self.storage_dir / 'results'
         results_dir.mkdir(exist_ok=True)
 
+        data = source.to_dict()
         result_path = results_dir / f"{source.source_id}.json"
         with open(result_path, 'w') as f:
-            json.dump(source.to_dict(), f, indent=2)
+            json.dump(data, f, indent=2)
+
+        self.stage8.record_result(data)
 
     def get_result(self, source_id: str) -> Optional[Source]:
         """Load processed result by source ID"""
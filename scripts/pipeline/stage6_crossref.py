@@ -10,9 +10,10 @@ Handles:
 """
 
 import json
+import sqlite3
 import hashlib
 from pathlib import Path
-from typing import List, Dict, Optional, Set, Tuple
+from typing import List, Dict, Optional, Set, Tuple, Iterator
 from collections import defaultdict
 from dataclasses import dataclass, field
 
@@ -39,12 +40,33 @@ class KnowledgeEntry:
     speaker: Optional[str] = None
 
 
+# Knowledge base index tables: key -> entry_id postings, one row per pair.
+# Rows are read in rowid order so results keep insertion order.
+INDEX_TABLES = ('content_hashes', 'entity_index', 'topic_index', 'speaker_index')
+
+# Trigram tables backing substring search in find_related: gram -> key.
+GRAM_TABLES = {'topic_index': 'topic_grams', 'entity_index': 'entity_grams'}
+
+# Padding appended to key text before cutting trigrams, so every character
+# position starts a gram and 1-2 character words become prefix range scans.
+GRAM_PAD = '\x00\x00'
+
+
+def _trigrams(text: str) -> Set[str]:
+    """Trigrams of text (callers pad with GRAM_PAD for index keys)"""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
 class Stage6CrossRef:
     """
     Stage 6: Cross-Reference
 
     Matches new content against existing knowledge base.
     Builds connections between sources and identifies duplicates.
+
+    The knowledge base index lives in SQLite (knowledge.db) so a
+    cross-reference run only reads and inserts the keys its segments use;
+    nothing is held in memory between queries.
     """
 
     def __init__(self, knowledge_base_path: str = None):
@@ -56,42 +78,128 @@ class Stage6CrossRef:
         """
         self.kb_path = Path(knowledge_base_path or '~/.arc8/knowledge_base').expanduser()
         self.kb_path.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.kb_path / 'knowledge.db'
 
-        # In-memory index for fast lookup
-        self.content_hashes: Dict[str, List[str]] = {}  # hash -> [entry_ids]
-        self.entity_index: Dict[str, List[str]] = {}    # entity -> [entry_ids]
-        self.topic_index: Dict[str, List[str]] = {}     # topic -> [entry_ids]
-        self.speaker_index: Dict[str, List[str]] = {}   # speaker -> [entry_ids]
-
+        self._conn: Optional[sqlite3.Connection] = None
         self._loaded = False
 
     def _load_knowledge_base(self):
-        """Load knowledge base into memory"""
+        """Open the knowledge base index, creating or migrating it if needed"""
         if self._loaded:
             return
 
-        index_file = self.kb_path / 'index.json'
-        if index_file.exists():
-            with open(index_file) as f:
-                data = json.load(f)
-                self.content_hashes = data.get('content_hashes', {})
-                self.entity_index = data.get('entity_index', {})
-                self.topic_index = data.get('topic_index', {})
-                self.speaker_index = data.get('speaker_index', {})
+        self._conn = sqlite3.connect(self.db_path)
+        self._conn.execute('PRAGMA journal_mode = WAL')
+        self._conn.execute('PRAGMA synchronous = NORMAL')
+
+        for table in INDEX_TABLES:
+            self._conn.execute(f'''
+                CREATE TABLE IF NOT EXISTS {table} (
+                    key TEXT NOT NULL,
+                    entry_id TEXT NOT NULL,
+                    UNIQUE(key, entry_id)
+                )
+            ''')
+        for gram_table in GRAM_TABLES.values():
+            self._conn.execute(f'''
+                CREATE TABLE IF NOT EXISTS {gram_table} (
+                    gram TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    PRIMARY KEY (gram, key)
+                ) WITHOUT ROWID
+            ''')
+        self._conn.commit()
+
+        self._migrate_json_index()
+        self._backfill_grams()
 
         self._loaded = True
-        print(f"[Stage6] Loaded knowledge base: {len(self.content_hashes)} content hashes")
+        count = self._conn.execute(
+            'SELECT COUNT(DISTINCT key) FROM content_hashes').fetchone()[0]
+        print(f"[Stage6] Opened knowledge base: {count} content hashes")
 
-    def _save_index(self):
-        """Save knowledge base index"""
+    def _migrate_json_index(self):
+        """Import a legacy index.json into SQLite (one-time)"""
         index_file = self.kb_path / 'index.json'
-        with open(index_file, 'w') as f:
-            json.dump({
-                'content_hashes': self.content_hashes,
-                'entity_index': self.entity_index,
-                'topic_index': self.topic_index,
-                'speaker_index': self.speaker_index,
-            }, f)
+        if not index_file.exists():
+            return
+
+        with open(index_file) as f:
+            data = json.load(f)
+
+        for table in INDEX_TABLES:
+            self._insert_postings(table, (
+                (key, entry_id)
+                for key, entry_ids in data.get(table, {}).items()
+                for entry_id in entry_ids
+            ))
+        self._save_index()
+
+        index_file.rename(index_file.with_suffix('.json.migrated'))
+        print(f"[Stage6] Migrated {index_file.name} into {self.db_path.name}")
+
+    def _backfill_grams(self):
+        """Build trigram tables for a knowledge base created before they existed"""
+        for table, gram_table in GRAM_TABLES.items():
+            if self._conn.execute(f'SELECT 1 FROM {gram_table} LIMIT 1').fetchone():
+                continue
+            keys = [row[0] for row in self._conn.execute(f'SELECT DISTINCT key FROM {table}')]
+            if keys:
+                self._insert_grams(table, keys)
+                self._save_index()
+
+    def _insert_postings(self, table: str, rows):
+        """Insert (key, entry_id) rows, ignoring pairs already present"""
+        rows = list(rows)
+        self._conn.executemany(
+            f'INSERT OR IGNORE INTO {table} (key, entry_id) VALUES (?, ?)', rows)
+        if table in GRAM_TABLES:
+            self._insert_grams(table, {key for key, _ in rows})
+
+    def _gram_text(self, table: str, key: str) -> str:
+        """Text of an index key that substring search matches against"""
+        if table == 'entity_index':
+            return key.split(':', 1)[1]
+        return key
+
+    def _insert_grams(self, table: str, keys):
+        """Add trigram postings for index keys"""
+        self._conn.executemany(
+            f'INSERT OR IGNORE INTO {GRAM_TABLES[table]} (gram, key) VALUES (?, ?)',
+            ((gram, key)
+             for key in keys
+             for gram in _trigrams(self._gram_text(table, key) + GRAM_PAD)))
+
+    def _lookup(self, table: str, keys: List[str], exclude: str = None,
+                limit: int = None) -> List[str]:
+        """Return distinct entry_ids posted under any of the given keys"""
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return []
+
+        placeholders = ','.join('?' * len(keys))
+        query = f'SELECT entry_id FROM {table} WHERE key IN ({placeholders})'
+        params: list = list(keys)
+        if exclude is not None:
+            query += ' AND entry_id != ?'
+            params.append(exclude)
+        query += ' GROUP BY entry_id ORDER BY MIN(rowid)'
+        if limit is not None:
+            query += ' LIMIT ?'
+            params.append(limit)
+
+        return [row[0] for row in self._conn.execute(query, params)]
+
+    def _save_index(self):
+        """Commit pending knowledge base inserts"""
+        self._conn.commit()
+
+    def close(self):
+        """Close the knowledge base connection"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        self._loaded = False
 
     def crossref(self, source: Source) -> Source:
         """
@@ -154,10 +262,7 @@ class Stage6CrossRef:
         content_hash = self._content_hash(segment.content_raw)
 
         # Exact match
-        if content_hash in self.content_hashes:
-            return self.content_hashes[content_hash]
-
-        return []
+        return self._lookup('content_hashes', [content_hash])
 
     def _handle_duplicates(self, segment: Segment, duplicate_ids: List[str]):
         """Handle duplicate content detection"""
@@ -173,28 +278,18 @@ class Stage6CrossRef:
 
     def _find_by_entities(self, segment: Segment) -> List[str]:
         """Find related content by shared entities"""
-        matches = set()
-
-        for entity in segment.entities:
-            key = f"{entity.type}:{entity.value.lower()}"
-            if key in self.entity_index:
-                matches.update(self.entity_index[key])
+        keys = [f"{entity.type}:{entity.value.lower()}" for entity in segment.entities]
 
-        # Remove self-references
-        matches.discard(segment.segment_id)
-        return list(matches)[:10]  # Limit results
+        # Exclude self-references, limit results
+        return self._lookup('entity_index', keys,
+                            exclude=segment.segment_id, limit=10)
 
     def _find_by_topics(self, segment: Segment) -> List[str]:
         """Find related content by shared topics"""
-        matches = set()
+        keys = [topic.lower() for topic in segment.topics]
 
-        for topic in segment.topics:
-            topic_lower = topic.lower()
-            if topic_lower in self.topic_index:
-                matches.update(self.topic_index[topic_lower])
-
-        matches.discard(segment.segment_id)
-        return list(matches)[:10]
+        return self._lookup('topic_index', keys,
+                            exclude=segment.segment_id, limit=10)
 
     def _find_by_speaker(self, segment: Segment) -> List[str]:
         """Find content from same speaker"""
@@ -202,12 +297,8 @@ class Stage6CrossRef:
             return []
 
         speaker_key = segment.speaker_name.lower()
-        if speaker_key in self.speaker_index:
-            matches = set(self.speaker_index[speaker_key])
-            matches.discard(segment.segment_id)
-            return list(matches)[:20]
-
-        return []
+        return self._lookup('speaker_index', [speaker_key],
+                            exclude=segment.segment_id, limit=20)
 
     def _create_connection(self, segment: Segment, related_id: str, connection_type: str):
         """Create a connection between segments"""
@@ -228,39 +319,31 @@ class Stage6CrossRef:
 
     def _add_to_knowledge_base(self, source: Source):
         """Add source segments to knowledge base"""
+        postings = defaultdict(list)
+
         for segment in source.segments:
             entry_id = segment.segment_id
 
             # Add content hash
             content_hash = self._content_hash(segment.content_raw)
-            if content_hash not in self.content_hashes:
-                self.content_hashes[content_hash] = []
-            if entry_id not in self.content_hashes[content_hash]:
-                self.content_hashes[content_hash].append(entry_id)
+            postings['content_hashes'].append((content_hash, entry_id))
 
             # Add to entity index
             for entity in segment.entities:
                 key = f"{entity.type}:{entity.value.lower()}"
-                if key not in self.entity_index:
-                    self.entity_index[key] = []
-                if entry_id not in self.entity_index[key]:
-                    self.entity_index[key].append(entry_id)
+                postings['entity_index'].append((key, entry_id))
 
             # Add to topic index
             for topic in segment.topics:
-                topic_lower = topic.lower()
-                if topic_lower not in self.topic_index:
-                    self.topic_index[topic_lower] = []
-                if entry_id not in self.topic_index[topic_lower]:
-                    self.topic_index[topic_lower].append(entry_id)
+                postings['topic_index'].append((topic.lower(), entry_id))
 
             # Add to speaker index
             if segment.speaker_name:
                 speaker_key = segment.speaker_name.lower()
-                if speaker_key not in self.speaker_index:
-                    self.speaker_index[speaker_key] = []
-                if entry_id not in self.speaker_index[speaker_key]:
-                    self.speaker_index[speaker_key].append(entry_id)
+                postings['speaker_index'].append((speaker_key, entry_id))
+
+        for table, rows in postings.items():
+            self._insert_postings(table, rows)
 
         # Save updated index
         self._save_index()
@@ -286,62 +369,171 @@ class Stage6CrossRef:
         Utility method for search integration.
         """
         self._load_knowledge_base()
-        results = []
 
         # Search by content similarity (basic keyword matching)
         query_words = set(query.lower().split())
 
+        # Deduplicate and limit as results are found; topics take precedence
+        seen = set()
+        unique_results = []
+
+        def add(result: Dict) -> bool:
+            if result['entry_id'] not in seen:
+                seen.add(result['entry_id'])
+                unique_results.append(result)
+            return len(unique_results) >= limit
+
         # Search topics
-        for topic, entry_ids in self.topic_index.items():
-            if any(word in topic for word in query_words):
-                for entry_id in entry_ids[:limit]:
-                    results.append({
-                        'entry_id': entry_id,
-                        'match_type': 'topic',
-                        'matched_value': topic
-                    })
+        for topic in self._substring_matches('topic_index', query_words):
+            for entry_id in self._lookup('topic_index', [topic], limit=limit):
+                if add({
+                    'entry_id': entry_id,
+                    'match_type': 'topic',
+                    'matched_value': topic
+                }):
+                    return unique_results
 
         # Search entities
-        for entity_key, entry_ids in self.entity_index.items():
+        for entity_key in self._substring_matches('entity_index', query_words):
             entity_type, entity_value = entity_key.split(':', 1)
-            if any(word in entity_value for word in query_words):
-                for entry_id in entry_ids[:limit]:
-                    results.append({
-                        'entry_id': entry_id,
-                        'match_type': 'entity',
-                        'entity_type': entity_type,
-                        'matched_value': entity_value
-                    })
-
-        # Deduplicate and limit
-        seen = set()
-        unique_results = []
-        for r in results:
-            if r['entry_id'] not in seen:
-                seen.add(r['entry_id'])
-                unique_results.append(r)
-                if len(unique_results) >= limit:
-                    break
+            for entry_id in self._lookup('entity_index', [entity_key], limit=limit):
+                if add({
+                    'entry_id': entry_id,
+                    'match_type': 'entity',
+                    'entity_type': entity_type,
+                    'matched_value': entity_value
+                }):
+                    return unique_results
 
         return unique_results
 
+    def _substring_matches(self, table: str, words: Set[str]) -> Iterator[str]:
+        """
+        Yield index keys whose text contains any of the words.
+
+        Words of 3+ characters are resolved by intersecting their trigram
+        postings; shorter words by a prefix range scan over the (padded)
+        grams. Candidates are verified with a real substring test.
+        """
+        gram_table = GRAM_TABLES[table]
+        emitted = set()
+
+        for word in sorted(words):
+            if len(word) >= 3:
+                grams = sorted(_trigrams(word))
+                placeholders = ','.join('?' * len(grams))
+                rows = self._conn.execute(
+                    f'''SELECT key FROM {gram_table} WHERE gram IN ({placeholders})
+                        GROUP BY key HAVING COUNT(*) = ?''',
+                    grams + [len(grams)])
+            else:
+                rows = self._conn.execute(
+                    f'''SELECT DISTINCT key FROM {gram_table}
+                        WHERE gram >= ? AND gram < ?''',
+                    (word, word + '\U0010ffff'))
+
+            for (key,) in rows:
+                if key not in emitted and word in self._gram_text(table, key):
+                    emitted.add(key)
+                    yield key
+
     def get_knowledge_stats(self) -> Dict:
         """Get knowledge base statistics"""
         self._load_knowledge_base()
 
+        def scalar(query: str) -> int:
+            return self._conn.execute(query).fetchone()[0]
+
         return {
-            'unique_content_hashes': len(self.content_hashes),
-            'total_entries': sum(len(v) for v in self.content_hashes.values()),
-            'unique_entities': len(self.entity_index),
-            'unique_topics': len(self.topic_index),
-            'unique_speakers': len(self.speaker_index),
+            'unique_content_hashes': scalar('SELECT COUNT(DISTINCT key) FROM content_hashes'),
+            'total_entries': scalar('SELECT COUNT(*) FROM content_hashes'),
+            'unique_entities': scalar('SELECT COUNT(DISTINCT key) FROM entity_index'),
+            'unique_topics': scalar('SELECT COUNT(DISTINCT key) FROM topic_index'),
+            'unique_speakers': scalar('SELECT COUNT(DISTINCT key) FROM speaker_index'),
         }
 
 
+def benchmark_find_related(n_keys: int = 1_000_000, n_queries: int = 200,
+                           kb_path: str = None) -> Dict:
+    """
+    Measure find_related latency against a synthetic entity index.
+
+    Builds a throwaway knowledge base with n_keys entity keys made of
+    random syllable names, then times n_queries lookups through the
+    trigram index and a handful through a full instr() scan for contrast.
+    """
+    import random
+    import tempfile
+    import time
+
+    rng = random.Random(42)
+    syllables = [c + v for c in 'bcdfghjklmnprstvwz' for v in 'aeiou'] + \
+                [v + c for v in 'aeiou' for c in 'lnrsx']
+    types = ['person', 'organization', 'location', 'date']
+
+    def name() -> str:
+        return ''.join(rng.choice(syllables) for _ in range(rng.randint(2, 4)))
+
+    kb_dir = kb_path or tempfile.mkdtemp(prefix='arc8_crossref_bench_')
+    crossref = Stage6CrossRef(knowledge_base_path=kb_dir)
+    crossref._load_knowledge_base()
+
+    started = time.perf_counter()
+    batch = []
+    for i in range(n_keys):
+        batch.append((f"{rng.choice(types)}:{name()} {name()}", f"seg-{i}"))
+        if len(batch) >= 50_000:
+            crossref._insert_postings('entity_index', batch)
+            batch = []
+    if batch:
+        crossref._insert_postings('entity_index', batch)
+    crossref._save_index()
+    build_seconds = time.perf_counter() - started
+
+    queries = [name()[:rng.randint(4, 7)] for _ in range(n_queries)]
+
+    latencies = []
+    for query in queries:
+        started = time.perf_counter()
+        crossref.find_related(query)
+        latencies.append((time.perf_counter() - started) * 1000)
+    latencies.sort()
+
+    # Unindexed baseline: every key tested, as find_related used to do
+    scan = []
+    for query in queries[:5]:
+        started = time.perf_counter()
+        crossref._conn.execute(
+            'SELECT DISTINCT key FROM entity_index WHERE instr(key, ?) > 0',
+            (query,)).fetchall()
+        scan.append((time.perf_counter() - started) * 1000)
+
+    crossref.close()
+
+    return {
+        'entity_keys': n_keys,
+        'queries': n_queries,
+        'build_seconds': round(build_seconds, 1),
+        'p50_ms': round(latencies[len(latencies) // 2], 2),
+        'p95_ms': round(latencies[int(len(latencies) * 0.95) - 1], 2),
+        'full_scan_ms': round(sum(scan) / len(scan), 2),
+        'kb_path': kb_dir,
+    }
+
+
 # CLI for testing
 if __name__ == '__main__':
     import sys
 
+    if len(sys.argv) >= 2 and sys.argv[1] == 'benchmark':
+        n = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000
+        result = benchmark_find_related(n_keys=n)
+        print(f"find_related over {result['entity_keys']:,} entity keys "
+              f"(index built in {result['build_seconds']}s):")
+        print(f"  p50: {result['p50_ms']} ms  p95: {result['p95_ms']} ms")
+        print(f"  full scan: {result['full_scan_ms']} ms")
+        sys.exit(0)
+
     crossref = Stage6CrossRef()
 
     if len(sys.argv) < 2:
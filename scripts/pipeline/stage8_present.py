@@ -9,14 +9,18 @@ Handles:
 - Training data export
 """
 
+import io
 import json
+import gzip
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Iterator, Iterable
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
 
 from .models import Source, Segment, ProcessingStatus, SourceType
 from .stage7_index import Stage7Index
 from .stage6_crossref import Stage6CrossRef
+from .catalog import ResultCatalog
 
 
 class PresentError(Exception):
@@ -24,6 +28,131 @@ class PresentError(Exception):
     pass
 
 
+def _training_examples(result_file: Path, min_weight: float,
+                       categories: Optional[List[str]]) -> List[Dict]:
+    """Training examples from one result file (module-level so it pickles)"""
+    result_file = Path(result_file)
+    if not result_file.exists():
+        return []
+
+    with open(result_file) as f:
+        data = json.load(f)
+
+    source_title = data.get('title', 'Unknown')
+    source_author = data.get('author', 'Unknown')
+
+    examples = []
+    for seg in data.get('segments', []):
+        weight = seg.get('training_weight', 1.0)
+        seg_categories = seg.get('training_categories', [])
+
+        # Apply filters
+        if weight < min_weight:
+            continue
+        if categories and not any(c in seg_categories for c in categories):
+            continue
+
+        examples.append({
+            'text': seg.get('content_raw', ''),
+            'source': source_title,
+            'author': source_author,
+            'speaker': seg.get('speaker_name'),
+            'segment_type': seg.get('segment_type'),
+            'weight': weight,
+            'categories': seg_categories,
+            'topics': seg.get('topics', []),
+            'entities': [
+                {'type': e.get('type'), 'value': e.get('value')}
+                for e in seg.get('entities', [])
+            ],
+        })
+
+    return examples
+
+
+def _training_lines(result_file: Path, min_weight: float,
+                    categories: Optional[List[str]]) -> List[str]:
+    """JSONL lines for one result file, serialized in the worker"""
+    return [json.dumps(item) + '\n'
+            for item in _training_examples(result_file, min_weight, categories)]
+
+
+class _ShardedJsonlWriter:
+    """
+    Writes JSONL lines to one file, or to numbered shards of a maximum
+    (uncompressed) size, compressing on the fly.
+    """
+
+    def __init__(self, output_path: str, compression: str = None,
+                 shard_bytes: int = None):
+        self.output_path = Path(output_path)
+        self.compression = compression or self._infer_compression(self.output_path)
+        self.shard_bytes = shard_bytes
+        self.paths: List[Path] = []
+        self._file = None
+        self._written = 0
+
+        if self.compression not in (None, 'gzip', 'zstd'):
+            raise PresentError(f"Unsupported compression: {self.compression}")
+        if self.compression == 'zstd':
+            try:
+                import zstandard  # noqa: F401
+            except ImportError:
+                raise PresentError("zstd compression requires: pip install zstandard")
+
+    @staticmethod
+    def _infer_compression(path: Path) -> Optional[str]:
+        if path.suffix == '.gz':
+            return 'gzip'
+        if path.suffix in ('.zst', '.zstd'):
+            return 'zstd'
+        return None
+
+    def _shard_path(self) -> Path:
+        if not self.shard_bytes:
+            return self.output_path
+        # data.jsonl.gz -> data-00000.jsonl.gz
+        name = self.output_path.name
+        stem, dot, rest = name.partition('.')
+        shard_name = f"{stem}-{len(self.paths):05d}{dot}{rest}"
+        return self.output_path.with_name(shard_name)
+
+    def _open(self):
+        path = self._shard_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if self.compression == 'gzip':
+            self._file = gzip.open(path, 'wt', encoding='utf-8')
+        elif self.compression == 'zstd':
+            import zstandard
+            raw = open(path, 'wb')
+            stream = zstandard.ZstdCompressor().stream_writer(raw, closefd=True)
+            self._file = io.TextIOWrapper(stream, encoding='utf-8')
+        else:
+            self._file = open(path, 'w', encoding='utf-8')
+        self.paths.append(path)
+        self._written = 0
+
+    def write(self, line: str):
+        if self._file is None or (self.shard_bytes and self._written >= self.shard_bytes):
+            self.close()
+            self._open()
+        self._file.write(line)
+        self._written += len(line)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        if not self.paths:
+            self._open()  # still produce an (empty) output file
+        self.close()
+
+
 class Stage8Present:
     """
     Stage 8: Presentation Layer
@@ -41,10 +170,54 @@ class Stage8Present:
         self.storage_dir = Path(storage_dir or '~/.arc8/pipeline').expanduser()
         self.results_dir = self.storage_dir / 'results'
 
+        # Summary catalog for listing and segment lookup
+        self.catalog = ResultCatalog(storage_dir=str(self.storage_dir))
+        self._catalog_checked = False
+        self.last_export_paths: List[str] = []
+
         # Initialize search index
         self.indexer = Stage7Index()
         self.crossref = Stage6CrossRef()
 
+    # ==================== Catalog ====================
+
+    def _ensure_catalog(self):
+        """
+        Index result files written before the catalog existed.
+
+        Relies on the catalog's persisted backfill flag rather than on it
+        being empty: the orchestrator records new results as they are
+        saved, so an existing install's catalog is never empty here.
+        """
+        if self._catalog_checked:
+            return
+        self._catalog_checked = True
+
+        if self.catalog.is_backfilled():
+            return
+        if self.results_dir.exists() and next(self.results_dir.glob('*.json'), None) is not None:
+            count = self.catalog.rebuild(self.results_dir)
+            print(f"[Stage8] Built result catalog: {count} sources")
+        else:
+            self.catalog.mark_backfilled()
+
+    def record_result(self, data: Dict):
+        """
+        Add a freshly saved result (Source.to_dict()) to the catalog.
+
+        Legacy result files are backfilled first, so recording this one
+        doesn't mask them.
+        """
+        self._ensure_catalog()
+        self.catalog.record(data)
+
+    def rebuild_catalog(self) -> int:
+        """Rebuild the catalog from all result files"""
+        self._catalog_checked = True
+        if not self.results_dir.exists():
+            return 0
+        return self.catalog.rebuild(self.results_dir)
+
     # ==================== Source Endpoints ====================
 
     def list_sources(self, page: int = 1, per_page: int = 20,
@@ -55,48 +228,21 @@ class Stage8Present:
         Returns:
             {sources: [...], total: int, page: int, pages: int}
         """
-        if not self.results_dir.exists():
-            return {'sources': [], 'total': 0, 'page': 1, 'pages': 0}
+        self._ensure_catalog()
 
-        # Collect all sources
-        all_sources = []
-        for result_file in self.results_dir.glob('*.json'):
-            try:
-                with open(result_file) as f:
-                    data = json.load(f)
-
-                # Apply filters
-                if source_type and data.get('source_type') != source_type:
-                    continue
-                if status and data.get('status') != status:
-                    continue
-
-                all_sources.append({
-                    'source_id': data['source_id'],
-                    'title': data.get('title', 'Untitled'),
-                    'author': data.get('author'),
-                    'source_type': data.get('source_type'),
-                    'status': data.get('status'),
-                    'duration': data.get('duration'),
-                    'segment_count': data.get('segment_count', len(data.get('segments', []))),
-                    'speaker_count': data.get('speaker_count', 0),
-                    'imported_date': data.get('imported_date'),
-                    'thumbnail': data.get('thumbnail_path'),
-                })
-            except (json.JSONDecodeError, KeyError):
-                continue
-
-        # Sort by import date
-        all_sources.sort(key=lambda x: x.get('imported_date', ''), reverse=True)
-
-        # Paginate
-        total = len(all_sources)
+        page = max(page, 1)
+        result = self.catalog.list_sources(
+            limit=per_page,
+            offset=(page - 1) * per_page,
+            source_type=source_type,
+            status=status,
+        )
+
+        total = result['total']
         pages = (total + per_page - 1) // per_page
-        start = (page - 1) * per_page
-        end = start + per_page
 
         return {
-            'sources': all_sources[start:end],
+            'sources': result['sources'],
             'total': total,
             'page': page,
             'pages': pages,
@@ -169,14 +315,22 @@ class Stage8Present:
 
     def get_segment(self, segment_id: str) -> Optional[Dict]:
         """Get single segment with full details"""
-        # Search through all sources for segment
-        for result_file in self.results_dir.glob('*.json'):
-            with open(result_file) as f:
-                data = json.load(f)
+        self._ensure_catalog()
+
+        source_id = self.catalog.get_source_id_for_segment(segment_id)
+        if not source_id:
+            return None
 
-            for seg in data.get('segments', []):
-                if seg.get('segment_id') == segment_id:
-                    return self._format_segment_detail(seg, data)
+        result_file = self.results_dir / f'{source_id}.json'
+        if not result_file.exists():
+            return None
+
+        with open(result_file) as f:
+            data = json.load(f)
+
+        for seg in data.get('segments', []):
+            if seg.get('segment_id') == segment_id:
+                return self._format_segment_detail(seg, data)
 
         return None
 
@@ -256,6 +410,29 @@ class Stage8Present:
 
     # ==================== Training Data Export ====================
 
+    def _training_files(self, source_id: str = None) -> Iterable[Path]:
+        """Result files to export, lazily globbed"""
+        if source_id:
+            return [self.results_dir / f'{source_id}.json']
+        return self.results_dir.glob('*.json')
+
+    def iter_training_data(self, source_id: str = None,
+                           min_weight: float = 0.5,
+                           categories: List[str] = None) -> Iterator[Dict]:
+        """
+        Stream segments formatted for training, one result file at a time.
+
+        Args:
+            source_id: Optional source filter
+            min_weight: Minimum training weight
+            categories: Filter by training categories
+
+        Yields:
+            Training examples
+        """
+        for result_file in self._training_files(source_id):
+            yield from _training_examples(result_file, min_weight, categories)
+
     def export_training_data(self, source_id: str = None,
                             min_weight: float = 0.5,
                             categories: List[str] = None) -> List[Dict]:
@@ -270,91 +447,72 @@ class Stage8Present:
         Returns:
             List of training examples
         """
-        training_data = []
+        return list(self.iter_training_data(source_id, min_weight, categories))
 
-        # Collect segments
-        if source_id:
-            files = [self.results_dir / f'{source_id}.json']
-        else:
-            files = list(self.results_dir.glob('*.json'))
-
-        for result_file in files:
-            if not result_file.exists():
-                continue
-
-            with open(result_file) as f:
-                data = json.load(f)
-
-            source_title = data.get('title', 'Unknown')
-            source_author = data.get('author', 'Unknown')
-
-            for seg in data.get('segments', []):
-                weight = seg.get('training_weight', 1.0)
-                seg_categories = seg.get('training_categories', [])
-
-                # Apply filters
-                if weight < min_weight:
-                    continue
-                if categories and not any(c in seg_categories for c in categories):
-                    continue
-
-                training_data.append({
-                    'text': seg.get('content_raw', ''),
-                    'source': source_title,
-                    'author': source_author,
-                    'speaker': seg.get('speaker_name'),
-                    'segment_type': seg.get('segment_type'),
-                    'weight': weight,
-                    'categories': seg_categories,
-                    'topics': seg.get('topics', []),
-                    'entities': [
-                        {'type': e.get('type'), 'value': e.get('value')}
-                        for e in seg.get('entities', [])
-                    ],
-                })
-
-        return training_data
-
-    def export_jsonl(self, output_path: str, source_id: str = None) -> int:
+    def _iter_training_lines(self, source_id: str, min_weight: float,
+                             categories: Optional[List[str]],
+                             workers: int) -> Iterator[str]:
         """
-        Export training data as JSONL file.
+        Yield JSONL lines per result file, optionally parsing files in a
+        process pool. At most 2 * workers files are in flight, so memory
+        stays bounded by a few result files rather than the whole archive.
+        """
+        files = iter(self._training_files(source_id))
+
+        if workers <= 1:
+            for result_file in files:
+                yield from _training_lines(result_file, min_weight, categories)
+            return
+
+        window = workers * 2
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = []
+            for result_file in files:
+                pending.append(executor.submit(
+                    _training_lines, result_file, min_weight, categories))
+                if len(pending) >= window:
+                    yield from pending.pop(0).result()
+            for future in pending:
+                yield from future.result()
+
+    def export_jsonl(self, output_path: str, source_id: str = None,
+                     min_weight: float = 0.5, categories: List[str] = None,
+                     compression: str = None, shard_size_mb: float = None,
+                     workers: int = 1) -> int:
+        """
+        Export training data as JSONL file, streaming one result file at a time.
+
+        Args:
+            output_path: Destination (.gz / .zst suffix selects compression)
+            source_id: Optional source filter
+            min_weight: Minimum training weight
+            categories: Filter by training categories
+            compression: 'gzip', 'zstd' or None (default: from suffix)
+            shard_size_mb: Split output into numbered shards of this size
+            workers: Result files parsed in parallel (process pool)
 
         Returns:
             Number of examples exported
         """
-        data = self.export_training_data(source_id=source_id)
+        shard_bytes = int(shard_size_mb * 1024 * 1024) if shard_size_mb else None
+        count = 0
 
-        with open(output_path, 'w') as f:
-            for item in data:
-                f.write(json.dumps(item) + '\n')
+        with _ShardedJsonlWriter(output_path, compression, shard_bytes) as writer:
+            for line in self._iter_training_lines(source_id, min_weight,
+                                                  categories, workers):
+                writer.write(line)
+                count += 1
 
-        return len(data)
+        self.last_export_paths = [str(p) for p in writer.paths]
+        return count
 
     # ==================== Statistics Endpoints ====================
 
     def get_stats(self) -> Dict:
         """Get overall pipeline statistics"""
-        sources = self.list_sources(per_page=1000)['sources']
-
-        stats = {
-            'total_sources': len(sources),
-            'total_segments': sum(s.get('segment_count', 0) for s in sources),
-            'total_duration': sum(s.get('duration') or 0 for s in sources),
-            'by_type': {},
-            'by_status': {},
-        }
+        self._ensure_catalog()
 
-        for s in sources:
-            source_type = s.get('source_type', 'unknown')
-            status = s.get('status', 'unknown')
-
-            if source_type not in stats['by_type']:
-                stats['by_type'][source_type] = 0
-            stats['by_type'][source_type] += 1
-
-            if status not in stats['by_status']:
-                stats['by_status'][status] = 0
-            stats['by_status'][status] += 1
+        stats = self.catalog.get_stats()
 
         # Add index stats
         stats['index'] = self.indexer.get_index_stats()
@@ -594,9 +752,19 @@ if __name__ == '__main__':
             print(f"\n  [{r['match_type']}] {r['segment_id']} (score: {r['score']:.3f})")
             print(f"    {r.get('text', '')[:100]}...")
 
+    elif sys.argv[1] == 'reindex':
+        count = presenter.rebuild_catalog()
+        print(f"Rebuilt result catalog: {count} sources")
+
     elif sys.argv[1] == 'export' and len(sys.argv) > 2:
-        count = presenter.export_jsonl(sys.argv[2])
-        print(f"Exported {count} training examples to {sys.argv[2]}")
+        options = dict(zip(sys.argv[3::2], sys.argv[4::2]))
+        count = presenter.export_jsonl(
+            sys.argv[2],
+            shard_size_mb=float(options['--shard-mb']) if '--shard-mb' in options else None,
+            workers=int(options.get('--workers', 1)),
+        )
+        print(f"Exported {count} training examples to "
+              f"{', '.join(presenter.last_export_paths) or sys.argv[2]}")
 
     else:
         print("Usage:")
@@ -604,4 +772,6 @@ if __name__ == '__main__':
         print("  python stage8_present.py list         # List sources")
         print("  python stage8_present.py get <id>     # Get source details")
         print("  python stage8_present.py search <q>   # Search content")
-        print("  python stage8_present.py export <f>   # Export training data")
+        print("  python stage8_present.py export <f> [--shard-mb N] [--workers N]")
+        print("                                        # Export training data (.gz/.zst compress)")
+        print("  python stage8_present.py reindex      # Rebuild result catalog")
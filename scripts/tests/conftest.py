@@ -0,0 +1,22 @@
+"""
+Shared pytest setup: make the scripts/ packages importable the same way
+the modules import each other (collectors.*, pipeline.*, minting.*, ...).
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    """A fresh BlockchainDB in tmp_path, returned by get_db() for the test"""
+    from collectors import blockchain_db
+
+    instance = blockchain_db.BlockchainDB(str(tmp_path / 'blockchain_tracking.db'))
+    monkeypatch.setattr(blockchain_db, '_db_instance', instance)
+    yield instance
+    instance.close()
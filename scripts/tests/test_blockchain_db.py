@@ -0,0 +1,39 @@
+from collectors.blockchain_db import normalize_address
+
+CHECKSUMMED = '0xAbCdEf0123456789aBcDeF0123456789AbCdEf01'
+
+
+def test_normalize_address():
+    assert normalize_address(CHECKSUMMED) == CHECKSUMMED.lower()
+    assert normalize_address('KT1AbCdEf') == 'KT1AbCdEf'
+    assert normalize_address('tz1XyZ') == 'tz1XyZ'
+    assert normalize_address(None) is None
+
+
+def test_contract_lookup_matches_any_case(db):
+    db.execute('INSERT INTO nft_mints (contract_address, token_id) VALUES (?, ?)',
+               (CHECKSUMMED, '7'))
+    db.execute('INSERT INTO nft_mints (contract_address, token_id) VALUES (?, ?)',
+               ('KT1AbCdEf', '7'))
+
+    def lookup(contract):
+        return db.execute('''
+            SELECT contract_address FROM nft_mints
+            WHERE contract_address_norm = ? AND token_id = ?
+        ''', (normalize_address(contract), '7'))
+
+    assert [r['contract_address'] for r in lookup(CHECKSUMMED.lower())] == [CHECKSUMMED]
+    assert [r['contract_address'] for r in lookup(CHECKSUMMED.upper().replace('0X', '0x'))] == [CHECKSUMMED]
+    # Tezos addresses are case-sensitive
+    assert lookup('kt1abcdef') == []
+    assert len(lookup('KT1AbCdEf')) == 1
+
+
+def test_contract_lookup_uses_index(db):
+    conn = db.get_connection()
+    plan = conn.execute('''
+        EXPLAIN QUERY PLAN SELECT id FROM nft_mints
+        WHERE contract_address_norm = ? AND token_id = ?
+    ''', ('0xabc', '1')).fetchall()
+    conn.close()
+    assert any('idx_nft_contract_norm' in row['detail'] for row in plan)
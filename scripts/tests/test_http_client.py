@@ -0,0 +1,86 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from collectors import http_client
+from collectors.http_client import HttpClient
+from collectors.request_scheduler import RequestScheduler
+
+
+@pytest.fixture
+def server():
+    """Local stub: /slow sleeps 0.5s, /unavailable always answers 503"""
+    state = {'requests': 0}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            with lock:
+                state['requests'] += 1
+            if self.path.startswith('/slow'):
+                time.sleep(0.5)
+            status = 503 if self.path.startswith('/unavailable') else 200
+            body = json.dumps({'path': self.path}).encode()
+            self.send_response(status)
+            self.send_header('Retry-After', '3600')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        do_POST = do_GET
+
+        def log_message(self, *args):
+            pass
+
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    state['base'] = f"http://127.0.0.1:{httpd.server_address[1]}"
+    yield state
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record retry backoffs instead of sleeping through them"""
+    recorded = []
+    monkeypatch.setattr(http_client.time, 'sleep', recorded.append)
+    return recorded
+
+
+def test_read_timeout_raises_timeout_without_retry(server):
+    client = HttpClient(backoff=0.01)
+    started = time.perf_counter()
+    with pytest.raises(requests.Timeout):
+        client.get(f"{server['base']}/slow", timeout=0.1)
+    assert time.perf_counter() - started < 0.4
+    assert server['requests'] == 1
+
+
+def test_retry_after_is_capped(server, sleeps):
+    client = HttpClient(retries=2)
+    response = client.get(f"{server['base']}/unavailable")
+    assert response.status_code == 503
+    assert server['requests'] == 3
+    assert sleeps == [http_client.RETRY_BACKOFF_MAX] * 2
+
+
+def test_post_is_not_retried(server, sleeps):
+    client = HttpClient()
+    assert client.post(f"{server['base']}/unavailable").status_code == 503
+    assert server['requests'] == 1
+    assert sleeps == []
+
+
+def test_scheduler_budget_drawn_per_attempt(server, sleeps):
+    scheduler = RequestScheduler(max_workers=1, budgets={'stub': (1000.0, 1000)},
+                                 http=HttpClient(retries=3))
+    scheduler.get(f"{server['base']}/unavailable", provider='stub')
+    assert server['requests'] == 4
+    assert scheduler.budgets['stub'].requests == 4
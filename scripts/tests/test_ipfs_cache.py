@@ -0,0 +1,70 @@
+import sqlite3
+
+import pytest
+
+from collectors.ipfs_cache import IPFSCache
+from processors import blockchain_nft_extractor
+
+CID = 'QmTestCid1234567890'
+
+
+class StubRacer:
+    def __init__(self, body=b'{"name": "work"}'):
+        self.body = body
+        self.calls = 0
+
+    def fetch(self, path, timeout=None):
+        self.calls += 1
+        return (self.body, 'https://stub/ipfs/') if self.body is not None else None
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return IPFSCache(db_path=str(tmp_path / 'db' / 'cache.db'),
+                     blob_dir=str(tmp_path / 'blobs'), racer=StubRacer())
+
+
+def _legacy_row(cache, content, size=10):
+    conn = sqlite3.connect(cache.db_path)
+    conn.execute('INSERT INTO ipfs_cache (ipfs_hash, content, size_bytes) VALUES (?, ?, ?)',
+                 (CID, content, size))
+    conn.commit()
+    conn.close()
+
+
+def test_legacy_absolute_content_is_a_miss(cache, tmp_path):
+    outside = tmp_path / 'secret.txt'
+    outside.write_text('not a blob')
+    _legacy_row(cache, str(outside))
+
+    assert cache.get(CID) is None
+    assert cache.fetch(CID) == b'{"name": "work"}'
+    assert cache.get(CID) == b'{"name": "work"}'
+
+
+def test_evict_never_unlinks_outside_blob_dir(cache, tmp_path):
+    outside = tmp_path / 'secret.txt'
+    outside.write_text('not a blob')
+    _legacy_row(cache, str(outside), size=10 ** 6)
+
+    assert cache.evict(max_bytes=0) == 1
+    assert outside.exists()
+
+
+def test_fetch_ipfs_content_survives_cache_write_failure(cache, monkeypatch):
+    def broken_put(*args, **kwargs):
+        raise OSError('disk full')
+
+    monkeypatch.setattr(cache, 'put', broken_put)
+    monkeypatch.setattr(blockchain_nft_extractor, 'get_ipfs_cache', lambda: cache)
+
+    assert blockchain_nft_extractor.fetch_ipfs_content(f'ipfs://{CID}/meta.json') == b'{"name": "work"}'
+    assert cache.racer.calls == 1
+
+
+def test_fetch_ipfs_content_uses_cache(cache, monkeypatch):
+    monkeypatch.setattr(blockchain_nft_extractor, 'get_ipfs_cache', lambda: cache)
+    blockchain_nft_extractor.fetch_ipfs_content(CID)
+    cache.racer.body = None
+    assert blockchain_nft_extractor.fetch_ipfs_content(f'ipfs://{CID}') == b'{"name": "work"}'
+    assert cache.racer.calls == 1
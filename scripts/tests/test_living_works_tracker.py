@@ -0,0 +1,90 @@
+import pytest
+
+from collectors.living_works_tracker import LiveWorkTracker
+from collectors.network_data_builder import NetworkDataBuilder
+
+CONTRACT = '0x1234567890abcdef1234567890abcdef12345678'
+
+
+class FakeWeb3:
+    """eth_getCode that fails until `code` is set"""
+
+    def __init__(self, code=None):
+        self.code = code
+        self.calls = 0
+
+    def rpc_call(self, method, params, timeout=30):
+        self.calls += 1
+        return self.code
+
+
+@pytest.fixture
+def tracker(db):
+    tracker = LiveWorkTracker()
+    tracker.web3 = FakeWeb3()
+    return tracker
+
+
+def test_failed_bytecode_lookup_not_cached(tracker):
+    assert tracker._get_bytecode(CONTRACT) is None
+    assert tracker.identify_reactivity_type(CONTRACT)['bytecode_checked'] is False
+
+    tracker.web3.code = '0x6042'
+    assert tracker._get_bytecode(CONTRACT) == '0x6042'
+    reactivity = tracker.identify_reactivity_type(CONTRACT)
+    assert reactivity['bytecode_checked'] is True
+    assert 'time_responsive' in reactivity['types']
+
+
+def test_empty_code_is_cached(tracker):
+    tracker.web3.code = '0x'
+    assert tracker._get_bytecode(CONTRACT) == '0x'
+    tracker.web3.code = None
+    assert tracker._get_bytecode(CONTRACT) == '0x'
+    assert tracker.web3.calls == 1
+
+
+def _reactivity_rows(db):
+    return db.execute('SELECT COUNT(*) AS n FROM nft_reactivity')[0]['n']
+
+
+def test_degraded_profile_not_persisted(db, tracker):
+    db.execute('INSERT INTO nft_mints (contract_address, token_id) VALUES (?, ?)',
+               (CONTRACT, '1'))
+
+    def build():
+        builder = NetworkDataBuilder(include_temporal=True)
+        builder.live_tracker = tracker
+        builder.nodes = {'nft-1': {'id': 'nft-1', 'type': 'nft',
+                                   'data': {'contract': CONTRACT, 'token_id': 1}}}
+        builder._add_temporal_data()
+
+    build()
+    assert _reactivity_rows(db) == 0
+
+    tracker.web3.code = '0x6042'
+    build()
+    assert _reactivity_rows(db) == 1
+
+
+def test_bad_row_only_skips_its_own_node(db, tracker):
+    other = '0x' + 'ab' * 20
+    broken = db.execute('INSERT INTO nft_mints (contract_address, token_id) VALUES (?, ?)',
+                        (other, '7'))[0]['last_id']
+    db.execute('INSERT INTO nft_mints (contract_address, token_id) VALUES (?, ?)',
+               (CONTRACT, '1'))
+    db.execute('INSERT INTO nft_reactivity (nft_id, is_reactive, reactivity_types) VALUES (?, ?, ?)',
+               (broken, True, '{not json'))
+    tracker.web3.code = '0x6042'
+
+    builder = NetworkDataBuilder(include_temporal=True)
+    builder.live_tracker = tracker
+    builder.nodes = {
+        'nft-broken': {'id': 'nft-broken', 'type': 'nft', 'data': {'contract': other, 'token_id': 7}},
+        'nft-1': {'id': 'nft-1', 'type': 'nft', 'data': {'contract': CONTRACT, 'token_id': 1}},
+    }
+    builder._add_temporal_data()
+
+    assert builder.nodes['nft-1']['temporal']['is_living'] is True
+    assert builder.nodes['nft-broken']['temporal']['is_living'] is False
+    assert _reactivity_rows(db) == 2
@@ -0,0 +1,44 @@
+from collectors.multicall import BatchResolver, LocalChainStub, MULTICALL3_ADDRESS
+
+OWNER = '0x' + 'ab' * 20
+TOKENS = {('0x' + '11' * 20, i): (OWNER, f'ipfs://token/{i}') for i in range(6)}
+
+
+class FlakyChain(LocalChainStub):
+    """aggregate3 fails (None, as when every provider errors) `failures` times"""
+
+    def __init__(self, failures, **kwargs):
+        super().__init__(TOKENS, **kwargs)
+        self.failures = failures
+
+    def rpc_call(self, method, params, timeout=30):
+        if params[0]['to'].lower() == MULTICALL3_ADDRESS.lower() and self.failures:
+            self.failures -= 1
+            self.round_trips += 1
+            return None
+        return super().rpc_call(method, params, timeout)
+
+
+def test_transient_failure_falls_back_for_one_batch():
+    resolver = BatchResolver(FlakyChain(failures=1), multicall_batch_size=3)
+    uris = resolver.token_uris(list(TOKENS))
+
+    assert uris == {token: uri for token, (_, uri) in TOKENS.items()}
+    assert resolver.multicall_available
+    assert resolver.stats['rpc_batch'] == 1
+    assert resolver.stats['multicall'] == 1
+
+
+def test_missing_multicall_contract_disables_it():
+    resolver = BatchResolver(LocalChainStub(TOKENS, multicall=False), multicall_batch_size=3)
+    owners = resolver.owners_of(list(TOKENS))
+
+    assert set(owners.values()) == {OWNER}
+    assert not resolver.multicall_available
+    assert resolver.stats['multicall'] == 0
+
+
+def test_unknown_tokens_resolve_to_none():
+    resolver = BatchResolver(LocalChainStub(TOKENS))
+    missing = ('0x' + '22' * 20, 1)
+    assert resolver.owners_of([missing]) == {missing: None}
@@ -0,0 +1,214 @@
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+from collectors.network_authenticity_analyzer import NetworkAnalysis, NetworkAuthenticityAnalyzer
+
+CONTRACT = '0xcontract'
+ARTIST = '0xartist'
+FIXER = '0xfixer'
+
+
+def _analyzer(tmp_path):
+    path = str(tmp_path / 'analysis.db')
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE nft_transfers (from_address TEXT, to_address TEXT,
+                                    contract_address TEXT, token_id TEXT, timestamp TEXT);
+        CREATE TABLE eth_transfers (from_address TEXT, to_address TEXT, value_eth REAL);
+        CREATE TABLE tracked_nfts (contract_address TEXT, token_id TEXT, creator_address TEXT);
+        INSERT INTO tracked_nfts VALUES ('0xcontract', '1', '0xartist');
+        INSERT INTO nft_transfers VALUES ('0xartist', '0xa', '0xcontract', '1', '2024-01-01T00:00:00');
+        INSERT INTO nft_transfers VALUES ('0xother', '0xb', '0xcontract', '2', '2024-01-02T00:00:00');
+    """)
+    conn.commit()
+    conn.close()
+    return NetworkAuthenticityAnalyzer(db_path=path)
+
+
+def _execute(analyzer, sql, params=()):
+    conn = sqlite3.connect(analyzer.db_path)
+    conn.execute(sql, params)
+    conn.commit()
+    conn.close()
+
+
+def _profiled(analyzer, monkeypatch, addresses):
+    """Run cached_profiles and return the addresses it re-profiled"""
+    seen = []
+    original = analyzer.profile_wallets
+
+    def spy(batch):
+        seen.extend(batch)
+        return original(batch)
+
+    monkeypatch.setattr(analyzer, 'profile_wallets', spy)
+    profiles = analyzer.cached_profiles(addresses)
+    return profiles, seen
+
+
+def test_unchanged_wallets_are_served_from_cache(tmp_path, monkeypatch):
+    analyzer = _analyzer(tmp_path)
+    _, first = _profiled(analyzer, monkeypatch, ['0xa', '0xb'])
+    profiles, second = _profiled(analyzer, monkeypatch, ['0xa', '0xb'])
+
+    assert sorted(first) == ['0xa', '0xb']
+    assert second == []
+    assert profiles['0xa'].artists_interacted == {ARTIST}
+
+
+def test_in_place_creator_correction_reprofiles_holders(tmp_path, monkeypatch):
+    analyzer = _analyzer(tmp_path)
+    analyzer.cached_profiles(['0xa', '0xb'])
+
+    _execute(analyzer, "UPDATE tracked_nfts SET creator_address = ? WHERE token_id = '1'", (FIXER,))
+    profiles, seen = _profiled(analyzer, monkeypatch, ['0xa', '0xb'])
+
+    assert seen == ['0xa']
+    assert profiles['0xa'].artists_interacted == {FIXER}
+
+
+def test_new_and_deleted_transfers_reprofile_their_wallets(tmp_path, monkeypatch):
+    analyzer = _analyzer(tmp_path)
+    analyzer.cached_profiles(['0xa', '0xb'])
+
+    _execute(analyzer, "INSERT INTO eth_transfers VALUES ('0xfunder', '0xb', 1.0)")
+    profiles, seen = _profiled(analyzer, monkeypatch, ['0xa', '0xb'])
+    assert seen == ['0xb']
+    assert profiles['0xb'].primary_funding_source == '0xfunder'
+
+    _execute(analyzer, "DELETE FROM nft_transfers WHERE to_address = '0xa'")
+    profiles, seen = _profiled(analyzer, monkeypatch, ['0xa', '0xb'])
+    assert seen == ['0xa']
+    assert profiles['0xa'].total_transactions == 0
+
+
+def test_change_log_survives_vacuum_and_is_pruned(tmp_path, monkeypatch):
+    analyzer = _analyzer(tmp_path)
+    analyzer.cached_profiles(['0xa', '0xb'])
+
+    conn = sqlite3.connect(analyzer.db_path)
+    conn.execute("DELETE FROM nft_transfers WHERE to_address = '0xb'")
+    conn.commit()
+    conn.execute("VACUUM")
+    conn.close()
+    _execute(analyzer, "UPDATE tracked_nfts SET creator_address = ? WHERE token_id = '1'", (FIXER,))
+
+    _, seen = _profiled(analyzer, monkeypatch, ['0xa', '0xb'])
+    assert sorted(seen) == ['0xa', '0xb']
+
+    conn = sqlite3.connect(analyzer.db_path)
+    remaining = conn.execute("SELECT COUNT(*) FROM wallet_profile_changes").fetchone()[0]
+    conn.close()
+    assert remaining == 0
+
+
+def test_installing_triggers_invalidates_existing_cache(tmp_path, monkeypatch):
+    analyzer = _analyzer(tmp_path)
+    analyzer.cached_profiles(['0xa'])
+
+    _execute(analyzer, "DROP TRIGGER trg_profile_changes_tracked_nfts_update")
+    _execute(analyzer, "UPDATE tracked_nfts SET creator_address = ? WHERE token_id = '1'", (FIXER,))
+    profiles, seen = _profiled(analyzer, monkeypatch, ['0xa'])
+
+    assert seen == ['0xa']
+    assert profiles['0xa'].artists_interacted == {FIXER}
+
+
+def _ring_finding(analyzer, rings, capped):
+    analysis = NetworkAnalysis(ARTIST, datetime.now(timezone.utc), circular_rings_capped=capped)
+    findings = analyzer._compile_findings(analysis, {}, [], rings, [])
+    return next(f for f in findings if f['type'] == 'circular_trading')
+
+
+def _ring_transfers(*rings, timestamp='2024-01-01T00:00:00'):
+    return [
+        {'from_address': a, 'to_address': b, 'timestamp': timestamp}
+        for ring in rings
+        for a, b in zip(ring, ring[1:] + ring[:1])
+    ]
+
+
+def test_ring_count_is_exact_when_search_completes(tmp_path):
+    analyzer = _analyzer(tmp_path)
+    rings, capped = analyzer._detect_circular_trading(
+        _ring_transfers(('0xa', '0xb', '0xc'), ('0xd', '0xe', '0xf')))
+    finding = _ring_finding(analyzer, rings, capped)
+
+    assert not capped
+    assert finding['description'].startswith('Found 2 ')
+    assert not finding['capped']
+
+
+def test_ring_count_is_a_lower_bound_when_capped(tmp_path, monkeypatch):
+    analyzer = _analyzer(tmp_path)
+    monkeypatch.setattr(analyzer, 'MAX_RINGS', 2)
+    rings, capped = analyzer._detect_circular_trading(
+        _ring_transfers(('0xa', '0xb', '0xc'), ('0xd', '0xe', '0xf'), ('0x1', '0x2', '0x3')))
+    finding = _ring_finding(analyzer, rings, capped)
+
+    assert len(rings) == 2 and capped
+    assert finding['description'].startswith('Found ≥2 ')
+    assert finding['capped']
+
+
+def test_search_budget_stops_dense_components(tmp_path, monkeypatch):
+    analyzer = _analyzer(tmp_path)
+    monkeypatch.setattr(analyzer, 'MAX_RING_SEARCH_STEPS', 5000)
+
+    # Complete digraph whose transfers are months apart: every cycle fails
+    # the time window, so the ring cap alone would never stop the search
+    wallets = [f'0x{i:02x}' for i in range(14)]
+    transfers = [
+        {'from_address': a, 'to_address': b,
+         'timestamp': (datetime(2020, 1, 1) + timedelta(days=90 * (i * 14 + j))).isoformat()}
+        for i, a in enumerate(wallets) for j, b in enumerate(wallets) if a != b
+    ]
+    rings, capped = analyzer._detect_circular_trading(transfers)
+
+    assert rings == [] and capped
+
+
+def test_budget_trip_reports_found_rings_as_lower_bound(tmp_path):
+    analyzer = _analyzer(tmp_path)
+    finding = _ring_finding(analyzer, [['0xa', '0xb', '0xc', '0xa']], capped=True)
+
+    assert finding['description'].startswith('Found ≥1 ')
+
+
+def _log_size(analyzer):
+    conn = sqlite3.connect(analyzer.db_path)
+    size = conn.execute("SELECT COUNT(*) FROM wallet_profile_changes").fetchone()[0]
+    conn.close()
+    return size
+
+
+def _age_profile(analyzer, address, days):
+    analyzed_at = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
+    _execute(analyzer, "UPDATE wallet_profiles SET analyzed_at = ? WHERE address = ?",
+             (analyzed_at, address))
+
+
+def test_abandoned_profile_does_not_pin_the_change_log(tmp_path):
+    analyzer = _analyzer(tmp_path)
+    analyzer.cached_profiles(['0xa', '0xb'])
+
+    # 0xb is never requested again while 0xa keeps changing
+    for i in range(3):
+        _execute(analyzer, "INSERT INTO eth_transfers VALUES ('0xfunder', '0xb', ?)", (i,))
+    _execute(analyzer, "INSERT INTO eth_transfers VALUES ('0xfunder', '0xa', 1.0)")
+    analyzer.cached_profiles(['0xa'])
+    assert _log_size(analyzer) == 4
+
+    _age_profile(analyzer, '0xb', analyzer.PROFILE_CACHE_MAX_AGE_DAYS + 1)
+    _execute(analyzer, "INSERT INTO eth_transfers VALUES ('0xfunder', '0xa', 2.0)")
+    analyzer.cached_profiles(['0xa'])
+    assert _log_size(analyzer) == 0
+
+
+def test_expired_profile_is_recomputed(tmp_path, monkeypatch):
+    analyzer = _analyzer(tmp_path)
+    analyzer.cached_profiles(['0xa', '0xb'])
+    _age_profile(analyzer, '0xb', analyzer.PROFILE_CACHE_MAX_AGE_DAYS + 1)
+
+    _, seen = _profiled(analyzer, monkeypatch, ['0xa', '0xb'])
+    assert seen == ['0xb']
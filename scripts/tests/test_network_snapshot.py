@@ -0,0 +1,122 @@
+from datetime import datetime
+
+import pytest
+
+from collectors import network_snapshot
+from collectors.network_snapshot import NetworkSnapshot
+
+
+class FakeBuilder:
+    """One node per address; stands in for NetworkDataBuilder"""
+
+    def build_from_database(self, address_ids):
+        return {'nodes': [{'id': f'addr-{a}'} for a in address_ids], 'edges': []}
+
+    def load_nodes_and_edges(self, nodes, edges):
+        return {'nodes': nodes, 'edges': edges, 'metadata': {}}
+
+
+@pytest.fixture
+def snapshot(db, monkeypatch):
+    monkeypatch.setattr(NetworkSnapshot, '_builder', lambda self: FakeBuilder())
+    monkeypatch.setattr(network_snapshot, '_memory_cache', {'version': None, 'data': None})
+    return NetworkSnapshot()
+
+
+def _address(db, address):
+    return db.execute('INSERT INTO tracked_addresses (address, network) VALUES (?, ?)',
+                      (address, 'ethereum'))[0]['last_id']
+
+
+def _sync(db, address_id, status='running'):
+    return db.execute('''
+        INSERT INTO sync_history (address_id, sync_type, started_at, status)
+        VALUES (?, 'incremental', ?, ?)
+    ''', (address_id, datetime.utcnow().isoformat(), status))[0]['last_id']
+
+
+def _finish(db, sync_id, status='success'):
+    db.execute('UPDATE sync_history SET status = ? WHERE id = ?', (status, sync_id))
+
+
+def test_out_of_order_sync_is_not_skipped(db, snapshot):
+    a, b = _address(db, '0xaaa'), _address(db, '0xbbb')
+    snapshot.refresh()
+
+    first = _sync(db, a)
+    second = _sync(db, b)
+
+    # The later sync finishes and is applied first
+    _finish(db, second)
+    snapshot.apply_address_delta([b], sync_id=second)
+    assert snapshot.get_stats()['last_sync_id'] < first
+
+    _finish(db, first)
+    pending = snapshot.pending_changes()
+    assert pending['rebuild'] == {a: first}
+
+    snapshot.refresh()
+    assert snapshot.get_stats()['last_sync_id'] == second
+    assert snapshot.pending_changes()['rebuild'] == {}
+
+
+def test_failed_snapshot_update_is_retried(db, snapshot):
+    a, b = _address(db, '0xaaa'), _address(db, '0xbbb')
+    snapshot.refresh()
+
+    # Sync of a succeeds but its delta never reaches the snapshot
+    lost = _sync(db, a, status='success')
+    later = _sync(db, b, status='success')
+    snapshot.apply_address_delta([b], sync_id=later)
+
+    assert snapshot.pending_changes()['rebuild'] == {a: lost}
+
+
+def test_watermark_skips_failed_syncs(db, snapshot):
+    a = _address(db, '0xaaa')
+    snapshot.refresh()
+
+    failed = _sync(db, a, status='failed')
+    ok = _sync(db, a, status='success')
+    snapshot.refresh()
+
+    stats = snapshot.get_stats()
+    assert stats['last_sync_id'] == ok > failed
+    conn = db.get_connection()
+    assert conn.execute('SELECT COUNT(*) FROM network_snapshot_applied_syncs').fetchone()[0] == 0
+    conn.close()
+
+
+def test_read_without_refresh(db, snapshot):
+    a = _address(db, '0xaaa')
+    version = snapshot.refresh()
+    _finish(db, _sync(db, a))
+
+    # Pending deltas are left for the background/cron refresh
+    data = snapshot.get_network_data(refresh=False)
+    assert data['metadata']['snapshot_version'] == version
+    assert snapshot.pending_changes()['rebuild'] == {a: snapshot.get_stats()['last_sync_id'] + 1}
+
+
+def test_cold_start_builds_synchronously(db, snapshot, monkeypatch):
+    _address(db, '0xaaa')
+    monkeypatch.setattr(snapshot, 'refresh_in_background',
+                        lambda: pytest.fail('cold start must not defer the build'))
+
+    data = snapshot.get_served_data()
+    assert [n['id'] for n in data['nodes']] == ['addr-1']
+    assert snapshot.is_built()
+
+
+def test_built_snapshot_is_served_while_refreshing_in_background(db, snapshot, monkeypatch):
+    a = _address(db, '0xaaa')
+    version = snapshot.refresh()
+    _address(db, '0xbbb')
+
+    started = []
+    monkeypatch.setattr(snapshot, 'refresh_in_background', lambda: started.append(True))
+
+    data = snapshot.get_served_data()
+    assert started == [True]
+    assert data['metadata']['snapshot_version'] == version
+    assert [n['id'] for n in data['nodes']] == [f'addr-{a}']
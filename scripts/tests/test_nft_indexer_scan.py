@@ -0,0 +1,40 @@
+from minting import nft_indexer_scan
+from minting.nft_indexer_scan import UnifiedNFTScanner
+from collectors.request_scheduler import RequestScheduler, INTERACTIVE
+
+
+class FakeAlchemy:
+    def __init__(self, scheduler):
+        self.scheduler = scheduler
+        self.priorities = []
+
+    def _page(self, label):
+        self.priorities.append(self.scheduler.current_priority)
+        return [label]
+
+    def get_nfts_for_owner(self, address, network):
+        return self._page('owned')
+
+    def get_minted_nfts(self, address, network):
+        return self._page('minted')
+
+    def get_nft_sales(self, address, network):
+        return self._page('sale')
+
+
+def test_scan_wallet_inside_pool_job_does_not_deadlock(monkeypatch):
+    monkeypatch.setenv('ALCHEMY_API_KEY', 'test')
+    scheduler = RequestScheduler(max_workers=1)
+    monkeypatch.setattr(nft_indexer_scan, 'get_scheduler', lambda: scheduler)
+
+    scanner = UnifiedNFTScanner()
+    scanner.alchemy = FakeAlchemy(scheduler)
+
+    # The only pool worker runs scan_wallet itself
+    future = scheduler.submit(scanner.scan_wallet, '0xabc', priority=INTERACTIVE)
+    result = future.result(timeout=5)
+
+    assert result['owned_nfts'] == ['owned']
+    assert result['minted_nfts'] == ['minted']
+    assert result['sales'] == ['sale']
+    assert scanner.alchemy.priorities == [INTERACTIVE] * 3
@@ -0,0 +1,50 @@
+import pytest
+
+from interface import reputation_score
+from interface.reputation_score import ReputationScorer
+
+
+@pytest.fixture
+def scorer(db, monkeypatch):
+    monkeypatch.setattr(reputation_score, 'BLOCKCHAIN_DB_PATH', db.db_path)
+    # _load_batch_jobs only reads the blockchain DB; skip the scores DB setup
+    return ReputationScorer.__new__(ReputationScorer)
+
+
+def _artist(db, address, collectors, transactions):
+    artist_id = db.execute('INSERT INTO tracked_addresses (address, network) VALUES (?, ?)',
+                           (address, 'ethereum'))[0]['last_id']
+    mint_id = db.execute('INSERT INTO nft_mints (address_id, contract_address, token_id) VALUES (?, ?, ?)',
+                         (artist_id, '0xcontract', address))[0]['last_id']
+    for collector in collectors:
+        db.execute('INSERT INTO collectors (collector_address, network, nft_mint_id) VALUES (?, ?, ?)',
+                   (collector, 'ethereum', mint_id))
+    for i, to_address in enumerate(transactions):
+        db.execute('''
+            INSERT INTO transactions (address_id, tx_hash, from_address, to_address, tx_type)
+            VALUES (?, ?, ?, ?, 'transfer')
+        ''', (artist_id, f'{address}-{i}', address, to_address))
+    return artist_id
+
+
+def test_batch_jobs_only_load_requested_artists(db, scorer):
+    _artist(db, '0xaaa', ['0xc1', '0xc2'], ['0xc1'])
+    b = _artist(db, '0xbbb', ['0xc3'], ['0xc3', '0xc4'])
+
+    jobs = scorer._load_batch_jobs([b, 999])
+
+    assert len(jobs) == 1
+    artist_id, address, collectors, transfers = jobs[0]
+    assert (artist_id, address, collectors) == (b, '0xbbb', ['0xc3'])
+    assert sorted(t['to_address'] for t in transfers) == ['0xc3', '0xc4']
+    assert 'address_id' not in transfers[0]
+
+
+def test_batch_jobs_default_to_every_artist(db, scorer):
+    a = _artist(db, '0xaaa', ['0xc1', '0xc2'], ['0xc1'])
+    b = _artist(db, '0xbbb', [], [])
+
+    jobs = scorer._load_batch_jobs()
+
+    assert [(job[0], sorted(job[2]), len(job[3])) for job in jobs] == [
+        (a, ['0xc1', '0xc2'], 1), (b, [], 0)]
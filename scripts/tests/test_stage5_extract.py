@@ -0,0 +1,67 @@
+"""Stage5Extract regex backend: precompiled patterns keep per-pattern semantics"""
+
+import re
+
+import pytest
+
+from pipeline.stage5_extract import Stage5Extract
+from pipeline.models import Segment
+
+SAMPLE = (
+    "Dr. Smith met Jane Doe in New York on March 3, 2024 and again on 12/05/2020. "
+    "The 1990s show at Tate Foundation cost $1,200.50 or 300 USD. In 2020 MoMA and "
+    "IBM Corp. visited Kansas City. Mail jane@example.org or see https://example.org/x. "
+    "I think prices will rise; research shows collectors should never sell."
+)
+
+
+def reference_entities(extractor, text):
+    """The original per-pattern loop"""
+    entities, seen = [], set()
+    for entity_type, patterns in extractor.entity_patterns.items():
+        for pattern in patterns:
+            for match in re.finditer(pattern, text, re.IGNORECASE):
+                value = match.group(0).strip()
+                if value and value not in seen and len(value) > 1:
+                    entities.append((entity_type, value, match.start(), match.end()))
+                    seen.add(value)
+    return entities
+
+
+def test_entities_match_per_pattern_loop():
+    extractor = Stage5Extract(use_spacy=False)
+    got = [(e.type, e.value, e.start_char, e.end_char)
+           for e in extractor._extract_entities_regex(SAMPLE)]
+    assert got == reference_entities(extractor, SAMPLE)
+
+
+def test_overlapping_years_are_kept():
+    extractor = Stage5Extract(use_spacy=False)
+    values = {(e.type, e.value) for e in extractor._extract_entities_regex(SAMPLE)}
+    # Nested inside the "March 3, 2024" and "12/05/2020" date spans
+    assert ('date', '2024') in values
+    assert ('date', '2020') in values
+
+
+def test_entity_matching_ignores_case():
+    extractor = Stage5Extract(use_spacy=False)
+    text = SAMPLE.lower()
+    got = [(e.type, e.value, e.start_char, e.end_char)
+           for e in extractor._extract_entities_regex(text)]
+    assert got == reference_entities(extractor, text)
+    assert {'person', 'organization', 'location'} <= {entity_type for entity_type, *_ in got}
+
+
+def test_claims_match_each_pattern_independently():
+    extractor = Stage5Extract(use_spacy=False)
+    segment = Segment(content_raw=SAMPLE)
+    claims = extractor._extract_claims(segment)
+    expected = sum(1 for pattern, _ in extractor.claim_patterns
+                   if re.search(pattern, SAMPLE, re.IGNORECASE))
+    assert len(claims) == expected == 5
+
+
+def test_subjectivity_counts_each_opinion_pattern():
+    extractor = Stage5Extract(use_spacy=False)
+    sentiment = extractor._analyze_sentiment("I think it might work")
+    assert sentiment.arousal == pytest.approx(0.9)
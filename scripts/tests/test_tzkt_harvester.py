@@ -0,0 +1,71 @@
+import pytest
+
+from collectors.request_scheduler import RequestScheduler
+from collectors.tzkt_harvester import TzKTHarvester, _TzKTStub
+
+ARTIST = 'tz1TestArtist'
+CONTRACT = {'address': 'KT1Test'}
+
+
+@pytest.fixture
+def stub():
+    stub = _TzKTStub()
+    for i in range(30):
+        token = stub.add('tokens', {'creator': ARTIST, 'contract': CONTRACT, 'tokenId': str(i),
+                                    'firstLevel': stub.level, 'lastLevel': stub.level})
+        stub.add('tokens/balances', {'account': {'address': f'tz1Collector{i}'},
+                                     'token': {'id': token['id']}, 'balance': '1',
+                                     'lastLevel': stub.level})
+    return stub
+
+
+@pytest.fixture
+def harvester(db, stub):
+    # Small pages so fetch_all splits into concurrent windows
+    harvester = TzKTHarvester(db, page_size=4)
+    harvester.scheduler = RequestScheduler(max_workers=2)
+    harvester._get = lambda path, params: stub.query(path, params)
+    return harvester
+
+
+def _resell(stub, token_id):
+    stub.level += 10
+    sold = next(r for r in stub.tables['tokens/balances'] if r['token']['id'] == token_id)
+    sold['balance'] = '0'
+    sold['lastLevel'] = stub.level
+    next(t for t in stub.tables['tokens'] if t['id'] == token_id)['lastLevel'] = stub.level
+    stub.add('tokens/balances', {'account': {'address': 'tz1NewOwner'}, 'token': {'id': token_id},
+                                 'balance': '1', 'lastLevel': stub.level})
+
+
+def test_tokens_cursor_waits_for_holders(harvester, stub, monkeypatch):
+    first = harvester.harvest_artist(ARTIST)
+    assert first['complete'] and len(first['tokens']) == 30
+    tokens_scope = harvester.scope('tokens', ARTIST)
+    cursor = harvester.cursor(tokens_scope)
+
+    token_id = first['tokens'][0]['id']
+    _resell(stub, token_id)
+
+    def fail(*args, **kwargs):
+        raise RuntimeError('holders down')
+
+    with monkeypatch.context() as m:
+        m.setattr(harvester, 'harvest_holders', fail)
+        assert harvester.harvest_artist(ARTIST)['complete'] is False
+    assert harvester.cursor(tokens_scope) == cursor
+
+    third = harvester.harvest_artist(ARTIST)
+    assert third['complete']
+    assert harvester.cursor(tokens_scope) == stub.level
+    holders = {(r['account'], r['token']) for r in third['holders']}
+    assert ('tz1NewOwner', token_id) in holders
+    assert ('tz1Collector0', token_id) not in holders
+
+
+def test_harvest_inside_pool_job(harvester):
+    harvester.scheduler = RequestScheduler(max_workers=1)
+    future = harvester.scheduler.submit(harvester.harvest_artist, ARTIST)
+    result = future.result(timeout=10)
+    assert result['complete']
+    assert len(result['holders']) == 30
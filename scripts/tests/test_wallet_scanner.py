@@ -0,0 +1,56 @@
+import pytest
+
+from collectors.wallet_scanner import WalletScanner
+
+ARTIST_ETH = '0x' + 'Ab' * 20
+ARTIST_TEZ = 'tz1' + 'a' * 33
+COLLECTOR = '0x' + 'Cd' * 20
+
+
+@pytest.fixture
+def scanner(db):
+    return WalletScanner()
+
+
+def _insert(db, table, **row):
+    columns = ', '.join(row)
+    marks = ', '.join('?' * len(row))
+    return db.execute(f'INSERT INTO {table} ({columns}) VALUES ({marks})',
+                      tuple(row.values()))[0]['last_id']
+
+
+def _mint(db, address_id, token_id, collector, network):
+    mint_id = _insert(db, 'nft_mints', address_id=address_id, contract_address='0x' + '1' * 40,
+                      token_id=str(token_id), platform='test')
+    _insert(db, 'collectors', collector_address=collector, network=network, nft_mint_id=mint_id)
+
+
+def test_overview_networks_share_one_key(db, scanner):
+    eth_id = _insert(db, 'tracked_addresses', address=ARTIST_ETH, network='ethereum')
+    tez_id = _insert(db, 'tracked_addresses', address=ARTIST_TEZ, network='tezos')
+    # Collected on Polygon from an address detected as 'ethereum'
+    _mint(db, eth_id, 1, COLLECTOR, 'polygon')
+    _mint(db, eth_id, 2, COLLECTOR.lower(), 'polygon')
+    _mint(db, tez_id, 3, 'tz1' + 'b' * 33, 'tezos')
+
+    overview = scanner.get_unified_artist_overview([ARTIST_ETH, ARTIST_TEZ])
+
+    assert overview['mints_by_network'] == {'ethereum': 2, 'tezos': 1}
+    assert overview['collectors_by_network'] == {'ethereum': 1, 'tezos': 1}
+    assert {a['network'] for a in overview['addresses']} == set(overview['mints_by_network'])
+    assert [a['collectors'] for a in overview['addresses']] == [1, 1]
+
+
+def test_overlap_holdings_ignore_case_variant_links(db, scanner):
+    artist_id = _insert(db, 'tracked_addresses', address=ARTIST_ETH, network='ethereum')
+    profile_id = _insert(db, 'social_profiles', display_name='collector')
+    _insert(db, 'profile_addresses', profile_id=profile_id, address=COLLECTOR, network='ethereum')
+    _insert(db, 'profile_addresses', profile_id=profile_id, address=COLLECTOR.lower(), network='ethereum')
+    _insert(db, 'profile_addresses', profile_id=profile_id, address='tz1' + 'c' * 33, network='tezos')
+    _mint(db, artist_id, 1, COLLECTOR, 'ethereum')
+    _mint(db, artist_id, 2, COLLECTOR, 'ethereum')
+
+    assert scanner.refresh_cross_chain_overlaps() == 1
+    row = db.execute("SELECT * FROM cross_chain_overlaps WHERE overlap_type = 'social_link'")[0]
+    assert row['ethereum_nfts_collected'] == 2
+    assert row['shared_artists'] == 1